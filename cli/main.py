@@ -6,11 +6,15 @@ Model Context Protocol servers with comprehensive debugging and session manageme
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, FrozenSet
 from dataclasses import dataclass
 
 # Add project root to Python path for imports
@@ -21,24 +25,40 @@ from src.client.mcp_client import AdvancedMCPCommunicationInterface
 from src.utils.formatters import formatter
 from servers.http.server_launcher import launcher
 
-# Tool configuration
-PERMITTED_TOOLS = [
+# Tool configuration (immutable, shared by every interface configuration)
+PERMITTED_TOOLS: FrozenSet[str] = frozenset({
     'celsius_to_fahrenheit',
     'fahrenheit_to_celsius', 
     'celsius_to_kelvin',
     'kelvin_to_celsius',
     'fahrenheit_to_kelvin',
     'kelvin_to_fahrenheit',
+    'batch_convert',
     'run_command'
-]
+})
+
+# Session commands that end the interactive loop
+EXIT_COMMANDS: FrozenSet[str] = frozenset({'quit', 'exit', ':q'})
 
 # Configure comprehensive logging
+# The log file is written by a background listener thread so that logging
+# from the event loop never blocks on disk I/O; records reach it already
+# formatted by the queue handler.
+_log_queue = queue.SimpleQueue()
+_file_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("mcp_interface.log"),
+    respect_handler_level=True
+)
+_file_log_listener.start()
+atexit.register(_file_log_listener.stop) # flush pending records on exit
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler("mcp_interface.log")
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 
@@ -49,18 +69,56 @@ logging.getLogger("google").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _write_console(*lines: str) -> None:
+    """
+    Write several console lines with a single write and flush.
+    
+    print() issues separate writes for the text and its line ending, and a
+    line-buffered terminal flushes each of them, so output blocks shown
+    together are coalesced into one write here.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+async def _read_user_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    The blocking read runs on a daemon thread so MCP streams keep being
+    serviced while waiting, and a pending prompt never delays shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    pending_line = loop.create_future()
+
+    def _deliver(setter, value) -> None:
+        if not pending_line.done():
+            setter(value)
+
+    def _reader() -> None:
+        try:
+            line = input(prompt)
+        except Exception as e:
+            outcome = (pending_line.set_exception, e)
+        else:
+            outcome = (pending_line.set_result, line)
+        try:
+            loop.call_soon_threadsafe(_deliver, *outcome)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=_reader, name="cli-input-reader", daemon=True).start()
+    return await pending_line
+
+
+@dataclass(slots=True)
 class InterfaceConfiguration:
     """Configuration settings for the CLI interface."""
     application_name: str = "universal_mcp_interface"
     user_identifier: str = "cli_user_001"
     session_identifier: str = "cli_session_001"
     verbose_debugging: bool = True
-    permitted_tools: List[str] = None
-    
-    def __post_init__(self):
-        if self.permitted_tools is None:
-            self.permitted_tools = PERMITTED_TOOLS
+    permitted_tools: FrozenSet[str] = PERMITTED_TOOLS
 
 class AdvancedMCPCommandLineInterface:
     """Sophisticated CLI for MCP communication with comprehensive debugging and server management."""
@@ -70,13 +128,20 @@ class AdvancedMCPCommandLineInterface:
         self.http_servers_active = False
         self.interface_config = InterfaceConfiguration()
     
+    async def __aenter__(self) -> "AdvancedMCPCommandLineInterface":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        # always release the session and servers, whatever ended the session
+        await self.terminate_session_and_cleanup()
+    
     async def activate_http_servers(self) -> bool:
         """Activate required HTTP servers with comprehensive health monitoring."""
         try:
             logger.info("Activating HTTP server infrastructure...")
             
             # Activate temperature conversion server
-            if launcher.start_temperature_server(port=8001):
+            if await launcher.start_temperature_server_in_process(port=8001):
                 self.http_servers_active = True
                 logger.info("Temperature conversion server activated successfully")
                 return True
@@ -85,7 +150,7 @@ class AdvancedMCPCommandLineInterface:
                 return False
                 
         except Exception as e:
-            logger.error(f"Error activating server infrastructure: {e}")
+            logger.error("Error activating server infrastructure: %s", e, exc_info=True)
             return False
     
     async def establish_communication_interface(self) -> bool:
@@ -106,8 +171,7 @@ class AdvancedMCPCommandLineInterface:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to establish communication interface: {e}")
-            formatter.create_error_response("Interface establishment failed", str(e))
+            logger.error("Failed to establish communication interface: %s", e, exc_info=True)
             return False
     
     async def interactive_communication_session(self) -> None:
@@ -121,28 +185,33 @@ class AdvancedMCPCommandLineInterface:
         print("  - 'help' - Display example requests and usage tips")
         print("  - 'quit', 'exit', ':q' - Terminate the application\n")
         
+        # Commands that take no arguments, dispatched by their lowercased text
+        command_handlers = {
+            'status': self._display_system_status,
+            'help': self._display_usage_help
+        }
+        
         try:
             while True:
                 try:
                     # Capture user input
-                    user_input = input("You: ").strip()
+                    user_input = (await _read_user_input("You: ")).strip()
                     
                     if not user_input:
                         continue
                     
                     # Process special commands
-                    if user_input.lower() in ['quit', 'exit', ':q']:
+                    command = user_input.lower()
+                    if command in EXIT_COMMANDS:
                         print("Session terminated. Goodbye!")
                         break
-                    elif user_input.lower() == 'status':
-                        self._display_system_status()
+                    command_handler = command_handlers.get(command)
+                    if command_handler is not None:
+                        command_handler()
                         continue
-                    elif user_input.lower().startswith('debug'):
+                    if command.startswith('debug'):
                         self._process_debug_command(user_input)
                         continue
-                    elif user_input.lower() == 'help':
-                        self._display_usage_help()
-                        continue
                     
                     # Process user input through communication interface
                     await self._process_user_input(user_input)
@@ -154,48 +223,53 @@ class AdvancedMCPCommandLineInterface:
                     print("\n\nInput stream ended. Goodbye!")
                     break
                 except Exception as e:
-                    logger.error(f"Error in communication session: {e}")
-                    formatter.create_error_response("An error occurred", str(e))
+                    logger.error("Error in communication session: %s", e, exc_info=True)
                     
         except Exception as e:
-            logger.error(f"Critical error in communication session: {e}")
-            formatter.create_error_response("Critical error occurred", str(e))
+            logger.error("Critical error in communication session: %s", e, exc_info=True)
     
     async def _process_user_input(self, user_input: str) -> None:
         """Process user input with comprehensive MCP interaction debugging."""
         event_sequence = 0
         final_agent_response = None
+        is_final_response = None # resolved once from the first event's type
         
         try:
-            print(f"\nAssistant: Processing your request...")
+            status_lines = ["\nAssistant: Processing your request..."]
             if self.interface_config.verbose_debugging:
-                print("[VERBOSE DEBUGGING] Displaying detailed MCP interactions:\n")
+                status_lines.append("[VERBOSE DEBUGGING] Displaying detailed MCP interactions:\n")
+            _write_console(*status_lines)
             
             async for response_event in self.communication_interface.process_user_input(user_input):
                 event_sequence += 1
                 
                 # In verbose debugging mode, detailed interactions are displayed by the interface
                 # Here we track event sequence and identify the final response
-                if hasattr(response_event, 'is_final_response') and response_event.is_final_response():
+                if is_final_response is None:
+                    # every event of a run has the same type, so look the check up only once
+                    is_final_response = getattr(type(response_event), 'is_final_response', False)
+                if is_final_response and is_final_response(response_event):
                     final_agent_response = response_event
                     break
             
-            # Display the final agent response
+            # Display the final agent response as one block
+            output_lines = []
+            response_parts = getattr(getattr(final_agent_response, 'content', None), 'parts', None)
             if final_agent_response and hasattr(final_agent_response, 'content'):
-                if hasattr(final_agent_response.content, 'parts') and final_agent_response.content.parts:
-                    response_content = final_agent_response.content.parts[0].text
-                    print(f"\nFinal Agent Response:\n{response_content}\n")
+                if response_parts:
+                    response_content = response_parts[0].text
+                    output_lines.append(f"\nFinal Agent Response:\n{response_content}\n")
                 else:
-                    print("Task completed successfully (no text response)\n")
+                    output_lines.append("Task completed successfully (no text response)\n")
             else:
-                print("No final response received from agent\n")
+                output_lines.append("No final response received from agent\n")
                 
             if self.interface_config.verbose_debugging:
-                print(f"Total events processed: {event_sequence}")
+                output_lines.append(f"Total events processed: {event_sequence}")
+            _write_console(*output_lines)
                 
         except Exception as e:
-            logger.error(f"Error processing user input: {e}")
-            formatter.create_error_response("Failed to process user input", str(e))
+            logger.error("Error processing user input: %s", e, exc_info=True)
     
     def _process_debug_command(self, command: str) -> None:
         """Process debug mode toggle commands."""
@@ -270,51 +344,80 @@ class AdvancedMCPCommandLineInterface:
         """Display welcome message for the communication session."""
         formatter.print_welcome_banner()
 
-    async def terminate_session_and_cleanup(self) -> None:
-        """Terminate session and cleanup all resources."""
+    async def run(self) -> int:
+        """Run the CLI from server activation to the end of the interactive session."""
         try:
-            if self.communication_interface:
-                await self.communication_interface.terminate_session()
+            # Activate server infrastructure
+            print("Initializing Advanced MCP Communication Interface with Verbose Debugging...")
+            
+            if not await self.activate_http_servers():
+                print("Failed to activate required server infrastructure")
+                return 1
             
-            if self.http_servers_active:
-                launcher.stop_all_servers()
+            # Establish communication interface
+            if not await self.establish_communication_interface():
+                print("Failed to establish communication interface")
+                return 1
+            
+            # Start interactive communication session with debugging
+            await self.interactive_communication_session()
+            
+            return 0
+            
+        except KeyboardInterrupt:
+            print("\nSession interrupted by user")
+            return 130
+        except Exception as e:
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            # the outermost handler is the only one that reports the error to the user
+            print(formatter.format_to_human_readable(
+                formatter.create_error_response(e, error_code="unexpected_error")
+            ))
+            return 1
+    
+    async def terminate_session_and_cleanup(self) -> None:
+        """
+        Terminate session and cleanup all resources.
+        
+        Session termination and server shutdown are independent, so they run
+        concurrently and cleanup takes as long as the slower of the two.
+        """
+        try:
+            async with asyncio.TaskGroup() as cleanup_tasks:
+                if self.communication_interface:
+                    cleanup_tasks.create_task(self.communication_interface.terminate_session())
+                
+                if self.http_servers_active:
+                    cleanup_tasks.create_task(self._stop_http_servers())
                 
         except Exception as e:
-            logger.error(f"Error during session termination and cleanup: {e}")
+            logger.error("Error during session termination and cleanup: %s", e, exc_info=True)
+    
+    async def _stop_http_servers(self) -> None:
+        """Stop every server started by the launcher and release its resources."""
+        try:
+            await launcher.stop_in_process_servers()
+            # stopping subprocess servers blocks while they exit, so keep it off the event loop
+            await asyncio.to_thread(launcher.stop_all_servers)
+        finally:
+            await launcher.close()
 
 async def main():
     """Main entry point for the advanced CLI application with comprehensive debugging."""
-    cli_interface = AdvancedMCPCommandLineInterface()
-    
+    async with AdvancedMCPCommandLineInterface() as cli_interface:
+        return await cli_interface.run()
+
+def _install_event_loop_policy() -> None:
+    """Use the libuv-backed uvloop event loop when it is available."""
     try:
-        # Activate server infrastructure
-        print("Initializing Advanced MCP Communication Interface with Verbose Debugging...")
-        
-        if not await cli_interface.activate_http_servers():
-            print("Failed to activate required server infrastructure")
-            return 1
-        
-        # Establish communication interface
-        if not await cli_interface.establish_communication_interface():
-            print("Failed to establish communication interface")
-            return 1
-        
-        # Start interactive communication session with debugging
-        await cli_interface.interactive_communication_session()
-        
-        return 0
-        
-    except KeyboardInterrupt:
-        print("\nSession interrupted by user")
-        return 130
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        formatter.create_error_response("Unexpected error occurred", str(e))
-        return 1
-    finally:
-        await cli_interface.terminate_session_and_cleanup()
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed - using the default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 if __name__ == "__main__":
+    _install_event_loop_policy()
     try:
         exit_code = asyncio.run(main())
         sys.exit(exit_code)
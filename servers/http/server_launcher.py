@@ -3,23 +3,107 @@ Launcher for HTTP MCP servers
 Provide utilities to start and manage HTTP MCP servers with health monitoring.
 """
 
+import asyncio
+import contextlib
+import os
+import signal
 import subprocess
 import sys
 import time
-import requests
+import httpx
 import logging
+import uvicorn
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+from .temperature_server import create_server
 
 logger = logging.getLogger(__name__)
 
+# Log file receiving the output of subprocess-launched servers
+SERVER_LOG_FILE = "temperature_server.log"
+
+class _InProcessServer(uvicorn.Server):
+    """Uvicorn server that leaves signal handling to the host application"""
+
+    def install_signal_handlers(self) -> None:
+        # uvicorn < 0.29 hook; the embedding CLI owns SIGINT/SIGTERM
+        pass
+
+    @contextlib.contextmanager
+    def capture_signals(self):
+        # uvicorn >= 0.29 hook; the embedding CLI owns SIGINT/SIGTERM
+        yield
+
+    async def serve(self, sockets=None) -> None:
+        try:
+            await super().serve(sockets)
+        except SystemExit:
+            # uvicorn exits the process on startup failure (e.g. port in use);
+            # contain it so only this server task ends
+            logger.error("In-process server failed to start")
+
 class ServerLauncher:
     """Manages HTTP MCP server lifecycle with health monitoring"""
 
     def __init__(self):
         self.processes: List[subprocess.Popen] = [] # Keeps a list of server processes it has started.
+        self.in_process_servers: List[Tuple[uvicorn.Server, asyncio.Task]] = [] # Servers hosted on the current event loop.
+        self._http_client: Optional[httpx.AsyncClient] = None # Pooled client shared by every health check.
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared health-check client, creating it on first use"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=0.5)
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the shared health-check client and its pooled connections"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def start_temperature_server_in_process(self, host: str = "localhost", port: int = 8001, timeout: float = 10) -> bool:
+        """Host the temperature conversion server on the running event loop
+
+        Avoids the interpreter start-up of a subprocess and the HTTP polling
+        needed to detect its readiness: uvicorn reports readiness directly.
+        """
+        try:
+            app = create_server(host, port).streamable_http_app()
+            server = _InProcessServer(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+
+            logger.info(f"Starting in-process temperature server on {host}:{port}")
+            task = asyncio.create_task(server.serve())
+            self.in_process_servers.append((server, task))
+
+            loop_time = asyncio.get_running_loop().time # bound once for the polling loop below
+            deadline = loop_time() + timeout
+            while not server.started:
+                if task.done() or loop_time() > deadline:
+                    if not task.done(): # a failed startup has already been reported by the server task
+                        logger.warning(f"server at {host}:{port} did not start in time")
+                    await self._discard_in_process_server(server, task, timeout)
+                    return False
+                await asyncio.sleep(0.01)
+
+            logger.info(f"Temperature server at {host}:{port} is ready")
+            return True
 
-    def start_temperature_server(self, host: str = "localhost", port: int = 8001) -> bool:
+        except Exception as e:
+            logger.error(f"Failed to start in-process temperature server: {str(e)}")
+            return False
+
+    async def _discard_in_process_server(self, server: uvicorn.Server, task: asyncio.Task, timeout: float) -> None:
+        """Stop an in-process server that failed to start and stop tracking it"""
+        server.should_exit = True # uvicorn skips its main loop once startup completes
+        try:
+            await asyncio.wait_for(task, timeout) # cancelled if startup itself hangs
+        except Exception as e:
+            logger.debug(f"In-process server ended with: {str(e)!r}")
+        self.in_process_servers.remove((server, task))
+
+    async def start_temperature_server(self, host: str = "localhost", port: int = 8001) -> bool:
         """Start the temperature conversion server with health monitoring"""
 
         try:
@@ -33,59 +117,102 @@ class ServerLauncher:
                 "--log-level", "INFO"
             ]
 
+            # keep bytecode caching on so repeat launches reuse the compiled imports
+            env = os.environ.copy()
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+
             logger.info(f"Starting temperature server on {host}:{port}")
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            # nothing reads the child's output, so never hand it a pipe that can fill up;
+            # its log records (stderr) go straight to a file instead
+            with open(SERVER_LOG_FILE, "ab") as server_log:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=server_log,
+                    env=env,
+                    close_fds=True,
+                    start_new_session=(os.name != "nt") # own process group: terminal signals stay with the CLI
+                )
 
             self.processes.append(process)
 
             # wait for server to be ready and verify health
-            return self._wait_for_server(host, port)
+            return await self._wait_for_server(host, port)
 
         except Exception as e:
             logger.error(f"Failed to start temperature server: {str(e)}")
             return False
 
-    def _wait_for_server(self, host: str, port: int, timeout: int = 10) -> bool:
+    async def _wait_for_server(self, host: str, port: int, timeout: float = 10) -> bool:
         """
         wait for server to become available with health checking"""
-        start_time = time.time()
-        url = f"http://{host}:{port}"
+        try:
+            await asyncio.wait_for(self._poll_until_ready(f"http://{host}:{port}/mcp"), timeout)
+            logger.info(f"Temperature server at {host}:{port} is ready")
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"server at {host}:{port} did not respond in time")
+            return False
 
-        while time.time() - start_time < timeout:
+    async def _poll_until_ready(self, url: str) -> None:
+        """Poll the MCP endpoint with exponential backoff (10 ms up to 640 ms)"""
+        delay = 0.01
+        client = self._get_http_client() # keep-alive connections are reused across polls and launches
+        while True:
             try:
                 # try to connect to the MCP endpoint
                 # we expect a 406 "not acceptable" response for stateless HTTP
                 # but needs proper MCP headers (this confirms the MCP server is active)
-                response = requests.get(f"{url}/mcp", timeout=5)
+                response = await client.get(url)
                 if response.status_code == 406 or "Not Acceptable" in response.text: # MCP server expects proper headers
-                    logger.info(f"Temperature server at {host}:{port} is ready")
-                    return True
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Failed to connect to temperature server: {str(e)}")
-                pass
-            time.sleep(1)
-        logger.warning(f"server at {host}:{port} did not respond in time")
-        return False
+                    return
+            except httpx.RequestError as e:
+                logger.debug(f"Temperature server not reachable yet: {str(e)}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.64)
 
     def stop_all_servers(self) -> None:
         """Stop all running servers"""
+        # signal every process first so they all shut down concurrently
+        for process in self.processes:
+            try:
+                if os.name != "nt":
+                    os.killpg(process.pid, signal.SIGTERM) # signal the server's whole process group
+                else:
+                    process.terminate() # send termination signal
+            except ProcessLookupError:
+                pass # already exited
+            except Exception as e:
+                logger.error(f"Failed to signal temperature server: {str(e)}")
+
+        # then share a single grace period across all of them
+        deadline = time.monotonic() + 5
         for process in self.processes:
             try:
-                process.terminate() # send termination signal
-                process.wait(timeout=5) # wait for process to terminate gracefully
+                process.wait(timeout=max(0, deadline - time.monotonic())) # wait for process to terminate gracefully
                 logger.info(f"Stopped temperature server process")
             except Exception as e:
                 logger.error(f"Failed to stop temperature server: {str(e)}")
                 try:
-                    process.kill() # force kill if needed or shutdown failed
+                    if os.name != "nt":
+                        os.killpg(process.pid, signal.SIGKILL) # force kill if needed or shutdown failed
+                    else:
+                        process.kill() # force kill if needed or shutdown failed
                 except:
                     pass
         self.processes.clear()
 
+    async def stop_in_process_servers(self) -> None:
+        """Stop all servers hosted on the current event loop"""
+        for server, task in self.in_process_servers:
+            server.should_exit = True # ask uvicorn to finish its main loop
+        for server, task in self.in_process_servers:
+            try:
+                await task
+                logger.info("Stopped in-process temperature server")
+            except Exception as e:
+                logger.error(f"Failed to stop in-process temperature server: {str(e)}")
+        self.in_process_servers.clear()
+
 # Global launcher instance
 launcher = ServerLauncher()
\ No newline at end of file
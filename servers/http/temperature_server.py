@@ -4,10 +4,139 @@ Provides temperature conversion capabilities through MCP HTTP protocol.
 """
 import click
 import logging
-from typing import Union
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from typing import Union, List, Literal
+from pydantic import BaseModel, Field
 from mcp.server.fastmcp import FastMCP
 
+logger = logging.getLogger(__name__)
+
+# Input/Output models for type safety and validation
+# The range limits are Field constraints, so pydantic-core checks them without a Python validator
+class TemperatureInput(BaseModel):
+    """Input model for temperature conversio with validation (Celsius: -273.15 to 100000)"""
+    temperature: float = Field(..., ge=-273.15, le=100000, description="Temperature value to convert")
+
+class FahrenheitInput(TemperatureInput):
+    """Input model for Fahrenheit temperatures (-459.67 to 100000)"""
+    temperature: float = Field(..., ge=-459.67, le=100000, description="Temperature value to convert")
+
+class KelvinInput(TemperatureInput):
+    """Input model for Kelvin temperatures (0 to 100000)"""
+    temperature: float = Field(..., ge=0.0, le=100000, description="Temperature value to convert")
+
+class TemperatureOutput(BaseModel):
+    """Output model for temperature conversion results"""
+    original_value: float = Field(..., description="Original temperature value")
+    original_scale: str = Field(..., description="Original temperature scale (C, F, K)")
+    converted_value: float = Field(..., description="Converted temperature value")
+    converted_scale: str = Field(..., description="Converted temperature scale (C, F, K)")
+    formula: str = Field(..., description="Conversion formula used")
+
+class BatchConversionInput(BaseModel):
+    """Input model for converting many temperatures in a single call"""
+    values: List[float] = Field(..., min_length=1, description="Temperature values to convert")
+    from_scale: Literal["C", "F", "K"] = Field(..., description="Scale of the input values (C, F, K)")
+    to_scale: Literal["C", "F", "K"] = Field(..., description="Scale to convert the values to (C, F, K)")
+
+class BatchConversionOutput(BaseModel):
+    """Output model for batch temperature conversion results"""
+    original_values: List[float] = Field(..., description="Original temperature values")
+    original_scale: str = Field(..., description="Original temperature scale (C, F, K)")
+    converted_values: List[float] = Field(..., description="Converted temperature values, in input order")
+    converted_scale: str = Field(..., description="Converted temperature scale (C, F, K)")
+    formula: str = Field(..., description="Conversion formula used")
+
+# core conversion logic (business logic): every conversion is affine,
+# converted = scale * value + offset, keyed by (from_scale, to_scale)
+CONVERSIONS = {
+    ("C", "F"): (9/5, 32.0, "F = (C * 9/5) + 32"),
+    ("F", "C"): (5/9, -32 * 5/9, "C = (F - 32) * 5/9"),
+    ("C", "K"): (1.0, 273.15, "K = C + 273.15"),
+    ("K", "C"): (1.0, -273.15, "C = K - 273.15"),
+    ("F", "K"): (5/9, -32 * 5/9 + 273.15, "K = (F - 32) * 5/9 + 273.15"),
+    ("K", "F"): (9/5, -273.15 * 9/5 + 32, "F = (K - 273.15) * 9/5 + 32"),
+}
+SCALE_NAMES = {"C": "celsius", "F": "fahrenheit", "K": "kelvin"}
+INPUT_MODELS = {"C": TemperatureInput, "F": FahrenheitInput, "K": KelvinInput}
+ABSOLUTE_ZERO = {"C": -273.15, "F": -459.67, "K": 0.0}
+
+
+def register_tools(mcp: FastMCP) -> None:
+    """Register the temperature conversion tools on an MCP server"""
+
+    def register_conversion_tool(from_scale: str, to_scale: str) -> None:
+        """Register the single-value conversion tool for one scale pair"""
+        scale, offset, formula = CONVERSIONS[(from_scale, to_scale)]
+        from_name, to_name = SCALE_NAMES[from_scale], SCALE_NAMES[to_scale]
+        input_model = INPUT_MODELS[from_scale] # enforces the source scale's absolute zero
+
+        async def convert_temperature(params: input_model) -> TemperatureOutput:
+            """ Convert a temperature between two scales with validation"""
+            return TemperatureOutput(
+                original_value=params.temperature,
+                original_scale=from_scale,
+                converted_value=scale * params.temperature + offset,
+                converted_scale=to_scale,
+                formula=formula
+            )
+
+        convert_temperature.__name__ = f"{from_name}_to_{to_name}"
+        mcp.tool(
+            name=convert_temperature.__name__,
+            description=f"Convert temperature from {from_name.capitalize()} to {to_name.capitalize()}",
+            title=f"{from_name} to {to_name} convertor"
+        )(convert_temperature)
+
+    for from_scale, to_scale in CONVERSIONS:
+        register_conversion_tool(from_scale, to_scale)
+
+    @mcp.tool(
+        description="Convert a list of temperatures between Celsius (C), Fahrenheit (F) and Kelvin (K) in one call",
+        title="batch temperature convertor"
+    )
+    async def batch_convert(params: BatchConversionInput) -> BatchConversionOutput:
+        """ Convert many temperatures at once with a single vectorized computation"""
+        if params.from_scale == params.to_scale:
+            raise ValueError("from_scale and to_scale must be different")
+
+        values = np.asarray(params.values, dtype=np.float64)
+        # NaN compares False against both bounds, so non-finite input is rejected first
+        if not np.isfinite(values).all():
+            raise ValueError("Temperatures must be finite numbers")
+        lower_bound = ABSOLUTE_ZERO[params.from_scale]
+        if values.min() < lower_bound:
+            raise ValueError(f"Temperatures cannot be below absolute zero ({lower_bound} {params.from_scale})")
+        if values.max() > 100000:
+            raise ValueError(f"Temperature must be between {lower_bound} and 100000")
+
+        # one multiply and one add over the whole buffer, in place
+        scale, offset, formula = CONVERSIONS[(params.from_scale, params.to_scale)]
+        np.multiply(values, scale, out=values)
+        np.add(values, offset, out=values)
+        return BatchConversionOutput(
+            original_values=params.values,
+            original_scale=params.from_scale,
+            converted_values=values.tolist(),
+            converted_scale=params.to_scale,
+            formula=formula
+        )
+
+
+def create_server(host: str = "localhost", port: int = 8001) -> FastMCP:
+    """Build the temperature conversion MCP server with all tools registered"""
+
+    # create FastMCP server with streamable  HTTP transport
+    mcp = FastMCP(
+        "temperature_converter",
+        host=host,
+        port=port,
+        stateless_http=True # Enable stateless HTTP transport
+        )
+    register_tools(mcp)
+    return mcp
+
+
 @click.command()
 @click.option("--port", default=8001, help="Port to run the server to")
 @click.option("--host", default="localhost", help="Host to bind the server to")
@@ -21,167 +150,9 @@ def main(port: int, host: str, log_level: str) -> None:
         level=getattr(logging, log_level.upper(), logging.INFO),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    logger = logging.getLogger(__name__)
     logger.info(f"Starting temperature conversion MCP server on {host}:{port}")
 
-    # create FastMCP server with streamable  HTTP transport
-    mcp = FastMCP(
-        "temperature_converter",
-        host=host,
-        port=port,
-        stateless_http=True # Enable stateless HTTP transport
-        )
-
-    # Input/Output models for type safety and validation
-    class TemperatureInput(BaseModel):
-        """Input model for temperature conversio with validation"""
-        temperature: float = Field(..., description="Temperature value to convert")
-
-        @field_validator("temperature")
-        @classmethod
-        def validate_temperature_range(cls, v):
-            """Validate temperature range between -273.15 and 100000"""
-            if v < -273.15 or v > 100000:
-                raise ValueError("Temperature must be between -273.15 and 100000")
-            return v
-    
-    class TemperatureOutput(BaseModel):
-        """Output model for temperature conversion results"""
-        original_value: float = Field(..., description="Original temperature value")
-        original_scale: str = Field(..., description="Original temperature scale (C, F, K)")
-        converted_value: float = Field(..., description="Converted temperature value")
-        converted_scale: str = Field(..., description="Converted temperature scale (C, F, K)")
-        formula: str = Field(..., description="Conversion formula used")
-
-    # core conversion functions(business logic)
-    def celcius_to_fahrenheit_calc(celsius: float) -> float:
-        """Convert Celsius to Fahrenheit using the formula: (C * 9/5) + 32"""
-        return (celsius * 9/5) + 32
-
-    def fahrenheit_to_celcius_calc(fahrenheit: float) -> float:
-        """Convert Fahrenheit to Celsius using the formula: (F - 32) * 5/9"""
-        return (fahrenheit - 32) * 5/9
-
-    def celcius_to_kelvin_calc(celsius: float) -> float:
-        """Convert Celsius to Kelvin using the formula: C + 273.15"""
-        return celsius + 273.15
-
-    def kelvin_to_celcius_calc(kelvin: float) -> float:
-        """Convert Kelvin to Celsius using the formula: K - 273.15"""
-        return kelvin - 273.15
-
-    def fahrenheit_to_kelvin_calc(fahrenheit: float) -> float:
-        """Convert Fahrenheit to Kelvin using the formula: (F - 32) * 5/9 + 273.15"""
-        return (fahrenheit - 32) * 5/9 + 273.15
-
-    def kelvin_to_fahrenheit_calc(kelvin: float) -> float:
-        """Convert Kelvin to Fahrenheit using the formula: (K - 273.15) * 9/5 + 32"""
-        return (kelvin - 273.15) * 9/5 + 32
-
-    # MCP tool Registrations - These become available to the client
-
-    @mcp.tool(
-        description="Convert temperature from Celsius to Fahrenheit",
-        title="celsius to fahrenheit convertor"
-    )
-    async def celsius_to_fahrenheit(params: TemperatureInput) -> TemperatureOutput:
-        """ Convert celsius to fahrenheit with validation"""
-        converted = celsius_to_fahrenheit_calc(params.temperature)
-        return TemperatureOutput(
-            original_value=params.temperature,
-            original_scale="C",
-            converted_value=converted,
-            converted_scale="F",
-            formula="F = (C * 9/5) + 32"
-        )
-    
-    @mcp.tool(
-        description="Convert temperature from Fahrenheit to Celsius",
-        title="fahrenheit to celsius convertor"
-    )
-    async def fahrenheit_to_celsius(params: TemperatureInput) -> TemperatureOutput:
-        """ Convert fahrenheit to celsius with validation"""
-        # Additional validation for fahrenheit absolute zero
-        if params.temperature < -459.67: # Below absolute zero fahrenheit
-            raise ValueError("Temperature cannot be below absolute zero Fahrenheit")
-        
-        converted = fahrenheit_to_celsius_calc(params.temperature)
-        return TemperatureOutput(
-            original_value=params.temperature,
-            original_scale="F",
-            converted_value=converted,
-            converted_scale="C",
-            formula="C = (F - 32) * 5/9"
-        )
-    
-    @mcp.tool(
-        description="Convert temperature from Celsius to Kelvin",
-        title="celsius to kelvin convertor"
-    )
-    async def celsius_to_kelvin(params: TemperatureInput) -> TemperatureOutput:
-        """ Convert celsius to kelvin with validation"""
-        converted = celcius_to_kelvin_calc(params.temperature)
-        return TemperatureOutput(
-            original_value=params.temperature,
-            original_scale="C",
-            converted_value=converted,
-            converted_scale="K",
-            formula="K = C + 273.15"
-        )
-    
-    @mcp.tool(
-        description="Convert temperature from Kelvin to Celsius",
-        title="kelvin to celsius convertor"
-    )
-    async def kelvin_to_celsius(params: TemperatureInput) -> TemperatureOutput:
-        """ Convert kelvin to celsius with validation"""
-        # kelvin cannot be below absolute zero
-        if params.temperature < 0:
-            raise ValueError("Temperature cannot be below absolute zero Kelvin")
-        converted = kelvin_to_celcius_calc(params.temperature)
-        return TemperatureOutput(
-            original_value=params.temperature,
-            original_scale="K",
-            converted_value=converted,
-            converted_scale="C",
-            formula="C = K - 273.15"
-        )
-
-    @mcp.tool(
-        description="Convert temperature from Fahrenheit to Kelvin",
-        title="fahrenheit to kelvin convertor"
-    )
-    async def fahrenheit_to_kelvin(params: TemperatureInput) -> TemperatureOutput:
-        """ Convert fahrenheit to kelvin with validation"""
-        # fahrenheit cannot be below absolute zero
-        if params.temperature < -459.67:
-            raise ValueError("Temperature cannot be below absolute zero Fahrenheit")
-        converted = fahrenheit_to_kelvin_calc(params.temperature)
-        return TemperatureOutput(
-            original_value=params.temperature,
-            original_scale="F",
-            converted_value=converted,
-            converted_scale="K",
-            formula="K = (F - 32) * 5/9 + 273.15"
-        )
-    
-    @mcp.tool(
-        description="Convert temperature from Kelvin to Fahrenheit",
-        title="kelvin to fahrenheit convertor"
-    )
-    async def kelvin_to_fahrenheit(params: TemperatureInput) -> TemperatureOutput:
-        """ Convert kelvin to fahrenheit with validation"""
-        # kelvin cannot be below absolute zero
-        if params.temperature < 0:
-            raise ValueError("Temperature cannot be below absolute zero Kelvin")
-        converted = kelvin_to_fahrenheit_calc(params.temperature)
-        return TemperatureOutput(
-            original_value=params.temperature,
-            original_scale="K",
-            converted_value=converted,
-            converted_scale="F",
-            formula="F = (K - 273.15) * 9/5 + 32"
-        )
+    mcp = create_server(host, port)
 
     # Start the server
     logger.info("Starting temperature conversion MCP server (HTTP transport)")
@@ -6,17 +6,28 @@ to terminal command execution within a sandboxed workspace environment.
 """
 
 import os
-import subprocess
+import shlex
+import shutil
+import signal
+import atexit
 import logging
+import logging.handlers
+import queue
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # Configure logging for the terminal server
-logging.basicConfig(level=logging.INFO)
+# Records are only enqueued on the event loop; a background listener thread
+# writes them to stderr, so request handling never waits on the stream.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop) # flush pending records on exit
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
 logger = logging.getLogger(__name__)
 
 # Initialize FastMCP server for stdio transport
@@ -27,15 +38,26 @@ WORKSPACE_DIRECTORY = Path(os.getenv("WORKSPACE_DIR", "workspace")).resolve()
 
 # Create workspace directory if it doesn't exist
 WORKSPACE_DIRECTORY.mkdir(exist_ok=True)
-logger.info(f"Terminal server workspace established at: {WORKSPACE_DIRECTORY}")
+logger.info("Terminal server workspace established at: %s", WORKSPACE_DIRECTORY)
+
+# Maximum bytes kept from each output stream of a command; the rest is drained and dropped
+MAX_CAPTURE_BYTES = 1 << 20
+
+# Seconds a command may run before it is killed
+COMMAND_TIMEOUT_SECONDS = 30
+
+# Characters that give a command shell semantics (pipes, redirection, expansion, globbing, ...)
+SHELL_SYNTAX_CHARACTERS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
 
 
 class SecureCommandRequest(BaseModel):
     """Secure command request model with input validation."""
+    # pydantic-core strips surrounding whitespace before the validator runs
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     command: str = Field(
         ...,
         description="Shell command to execute within the secure workspace environment",
-        min_length=1,
         max_length=1000
     )
     
@@ -43,20 +65,61 @@ class SecureCommandRequest(BaseModel):
     @classmethod
     def validate_command(cls, v):
         """Validate command input for security."""
-        if not v.strip():
+        if not v:
             raise ValueError("Command cannot be empty")
-        return v.strip()
+        return v
 
 
 class CommandExecutionResult(BaseModel):
     """Comprehensive command execution result model."""
+    model_config = ConfigDict(frozen=True)
+
     command: str = Field(..., description="The command that was executed")
     exit_code: int = Field(..., description="Process exit code (0 indicates success)")
-    stdout: str = Field(..., description="Standard output from the command")
-    stderr: str = Field(..., description="Standard error output from the command")
+    stdout: str = Field(..., description="Standard output from the command (truncated beyond 1 MiB)")
+    stderr: str = Field(..., description="Standard error output from the command (truncated beyond 1 MiB)")
     working_directory: str = Field(..., description="The directory where the command was executed")
     execution_time: Optional[float] = Field(None, description="Time taken to execute the command")
 
+
+def _split_simple_command(command: str) -> Optional[List[str]]:
+    """
+    Split a command that can run without a shell into its argument vector.
+
+    Returns None when the command needs /bin/sh: it uses shell syntax, cannot
+    be tokenized, names a program by path, or names something that is not an
+    executable on PATH (shell builtins such as cd, keywords, or unknown
+    commands, whose errors the shell reports as usual).
+    """
+    if os.name == "nt" or not SHELL_SYNTAX_CHARACTERS.isdisjoint(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None  # e.g. unbalanced quotes; let the shell report it
+    if not argv or os.sep in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+async def _read_capped_output(stream: asyncio.StreamReader) -> str:
+    """
+    Drain a command output stream, keeping at most MAX_CAPTURE_BYTES of it.
+
+    The stream is read to the end so the command never blocks on a full pipe,
+    but memory use stays bounded however much the command writes.
+    """
+    captured = bytearray()
+    total_bytes = 0
+    while chunk := await stream.read(65536):
+        total_bytes += len(chunk)
+        if len(captured) < MAX_CAPTURE_BYTES:
+            captured += chunk[:MAX_CAPTURE_BYTES - len(captured)]
+
+    output = captured.decode(errors="replace")
+    if total_bytes > MAX_CAPTURE_BYTES:
+        output += f"\n... [output truncated, {total_bytes - MAX_CAPTURE_BYTES} further bytes discarded]"
+    return output
+
 @mcp_server.tool(
     description="Execute shell commands within a secure workspace environment. Ideal for file operations, text processing, and system administration tasks.",
     title="Secure Command Executor"
@@ -78,62 +141,88 @@ async def execute_secure_command(request: SecureCommandRequest) -> CommandExecut
         CommandExecutionResult with complete execution details
     """
     command = request.command
-    start_time = asyncio.get_event_loop().time()
+    loop_time = asyncio.get_running_loop().time  # bound once, reused for every timing sample
+    start_time = loop_time()
 
     # Log command execution for audit purposes
-    logger.info(f"Executing secure command: {command}")
+    logger.info("Executing secure command: %s", command)
 
     try:
-        # Execute command within the secure workspace with timeout protection
-        process_result = subprocess.run(
-            command,
-            shell=True,
+        # Execute command within the secure workspace without blocking the event loop,
+        # so other requests on this server keep being served while it runs
+        process_options = dict(
             cwd=WORKSPACE_DIRECTORY,  # Restrict execution to workspace
-            capture_output=True,  # Capture all output streams
-            text=True,
-            timeout=30  # 30-second timeout for safety
+            stdout=asyncio.subprocess.PIPE,  # Capture all output streams
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=(os.name != "nt")  # own process group, so a timeout can stop the whole command
         )
-
-        end_time = asyncio.get_event_loop().time()
+        argv = _split_simple_command(command)
+        if argv is not None:
+            # plain program invocation: exec it directly instead of forking /bin/sh first
+            process = await asyncio.create_subprocess_exec(*argv, **process_options)
+        else:
+            process = await asyncio.create_subprocess_shell(command, **process_options)
+        try:
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_capped_output(process.stdout),
+                    _read_capped_output(process.stderr),
+                    process.wait()
+                ),
+                timeout=COMMAND_TIMEOUT_SECONDS  # timeout for safety
+            )
+        except asyncio.TimeoutError:
+            # kill the shell together with anything it started, which would otherwise keep the pipes open
+            try:
+                if os.name != "nt":
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except ProcessLookupError:
+                pass # already exited
+            await process.wait()
+            raise
+
+        end_time = loop_time()
         execution_time = end_time - start_time
 
         # Create comprehensive result object
         execution_result = CommandExecutionResult(
             command=command,
-            exit_code=process_result.returncode,
-            stdout=process_result.stdout,
-            stderr=process_result.stderr,
+            exit_code=process.returncode,
+            stdout=stdout,
+            stderr=stderr,
             working_directory=str(WORKSPACE_DIRECTORY),
             execution_time=execution_time
         )
 
         # Log execution summary for monitoring
-        execution_status = "SUCCESS" if process_result.returncode == 0 else "FAILED"
-        logger.info(f"{execution_status}: Command '{command}' completed in {execution_time:.2f}s with exit code {process_result.returncode}")
+        execution_status = "SUCCESS" if process.returncode == 0 else "FAILED"
+        logger.info("%s: Command '%s' completed in %.2fs with exit code %d", execution_status, command, execution_time, process.returncode)
 
         return execution_result
 
-    except subprocess.TimeoutExpired:
-        end_time = asyncio.get_event_loop().time()
+    except asyncio.TimeoutError:
+        end_time = loop_time()
         execution_time = end_time - start_time
         
-        logger.error(f"Command '{command}' exceeded timeout limit after {execution_time:.2f} seconds")
+        logger.error("Command '%s' exceeded timeout limit after %.2f seconds", command, execution_time)
         
         return CommandExecutionResult(
             command=command,
             exit_code=-1,
             stdout="",
-            stderr=f"Command execution timed out after 30 seconds",
+            stderr=f"Command execution timed out after {COMMAND_TIMEOUT_SECONDS} seconds",
             working_directory=str(WORKSPACE_DIRECTORY),
             execution_time=execution_time
         )
     
     except Exception as e:
-        end_time = asyncio.get_event_loop().time()
+        end_time = loop_time()
         execution_time = end_time - start_time
         
         error_message = f"Command execution failed: {str(e)}"
-        logger.error(f"Command '{command}' failed: {error_message}")
+        logger.error("Command '%s' failed: %s", command, error_message)
         
         return CommandExecutionResult(
             command=command,
@@ -147,7 +236,7 @@ async def execute_secure_command(request: SecureCommandRequest) -> CommandExecut
 
 if __name__ == "__main__":
     logger.info("Initializing secure terminal server with stdio transport")
-    logger.info(f"Workspace directory: {WORKSPACE_DIRECTORY}")
+    logger.info("Workspace directory: %s", WORKSPACE_DIRECTORY)
     
     # Start the MCP server with stdio transport
     mcp_server.run(transport="stdio")
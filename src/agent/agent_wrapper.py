@@ -8,19 +8,16 @@ with Google's AI Development Kit and Model Context Protocol servers.
 import logging
 import asyncio
 import os
-import sys
-from typing import List, Dict, Any, Optional, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, List, Dict, Any, FrozenSet, Iterable, Mapping, Optional, Tuple, Union, Final
 from pathlib import Path
 from dataclasses import dataclass, field
 
 # Third-party imports
-try:
-    from google.adk import Agent, Runner
-    from google.adk.sessions import InMemorySessionService
-    from mcp import StdioServerParameters
-except ImportError as e:
-    logging.error(f"Missing required Google ADK dependencies: {e}")
-    sys.exit(1)
+# google.adk pulls in protobuf, grpc and the GenAI SDK, so it is imported
+# when the agent is first built rather than whenever this module is imported
+if TYPE_CHECKING:
+    from google.adk import Agent
 
 # Local imports
 from src.utils.config_loader import config_loader
@@ -28,8 +25,55 @@ from src.utils.formatters import formatter
 
 logger = logging.getLogger(__name__)
 
+# System instructions given to the AI agent
+_AGENT_INSTRUCTIONS: Final[str] = """You are an advanced AI assistant with integrated access to specialized tools and capabilities.
 
-@dataclass
+Your primary functions include:
+• Temperature conversion operations between Celsius, Fahrenheit, and Kelvin scales
+• Local file system operations and terminal command execution
+• Comprehensive explanations of mathematical formulas and processes
+
+For temperature conversions:
+• Validate input values against physical constraints
+• Display the specific conversion formula utilized
+• Round numerical results to appropriate precision levels
+• Process multiple sequential conversions when requested
+
+For file operations:
+• Utilize available terminal tools for file creation, reading, and modification
+• Present output in clear, professional formatting
+• Verify successful completion of file operations
+
+Maintain precision, provide educational value, and demonstrate your methodology clearly."""
+
+# Project root, used to resolve relative server script paths; kept as a string
+# so resolving arguments is a plain os.path.join rather than a Path per argument
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+
+# Mock tool catalogues, built once and shared by every orchestrator
+_TEMPERATURE_MOCK_TOOLS = (
+    {"name": "celsius_to_fahrenheit", "description": "Convert Celsius to Fahrenheit"},
+    {"name": "fahrenheit_to_celsius", "description": "Convert Fahrenheit to Celsius"},
+    {"name": "celsius_to_kelvin", "description": "Convert Celsius to Kelvin"},
+    {"name": "kelvin_to_celsius", "description": "Convert Kelvin to Celsius"},
+    {"name": "fahrenheit_to_kelvin", "description": "Convert Fahrenheit to Kelvin"},
+    {"name": "kelvin_to_fahrenheit", "description": "Convert Kelvin to Fahrenheit"},
+    {"name": "batch_convert", "description": "Convert a list of temperatures between scales in one call"}
+)
+_TERMINAL_MOCK_TOOLS = (
+    {"name": "run_command", "description": "Execute terminal commands"},
+    {"name": "list_directory", "description": "List directory contents"},
+    {"name": "read_file", "description": "Read file contents"},
+    {"name": "write_file", "description": "Write content to file"}
+)
+# (server name fragment, tools) pairs, checked in order
+_MOCK_TOOL_MATCHERS = (
+    ("temperature", _TEMPERATURE_MOCK_TOOLS),
+    ("terminal", _TERMINAL_MOCK_TOOLS)
+)
+
+
+@dataclass(slots=True)
 class ServerConnectionStatus:
     """Represents the connection status of an MCP server."""
     name: str
@@ -39,14 +83,14 @@ class ServerConnectionStatus:
     connection_time: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfiguration:
     """Configuration settings for the AI agent."""
     model_name: str = "gemini-2.0-flash-exp"
     agent_name: str = "Universal_MCP_Assistant"
     max_retry_attempts: int = 3
     connection_timeout: int = 30
-    tool_filter: Optional[List[str]] = field(default_factory=list)
+    tool_filter: FrozenSet[str] = field(default_factory=frozenset)
 
 
 class MCPAgentOrchestrator:
@@ -58,19 +102,19 @@ class MCPAgentOrchestrator:
     tool discovery, and health monitoring.
     """
 
-    def __init__(self, tool_allowlist: Optional[List[str]] = None):
+    def __init__(self, tool_allowlist: Optional[Iterable[str]] = None):
         """
         Initialize the MCP agent orchestrator.
         
         Args:
-            tool_allowlist: Optional list of tool names to restrict access to.
+            tool_allowlist: Optional collection of tool names to restrict access to.
                           If None, all available tools are loaded.
         """
         self.config = AgentConfiguration()
         if tool_allowlist:
-            self.config.tool_filter = tool_allowlist
+            self.config.tool_filter = frozenset(tool_allowlist) # O(1) membership checks per tool
             
-        self.ai_agent: Optional[Agent] = None
+        self.ai_agent: Optional["Agent"] = None
         self.active_toolsets: List[Any] = []
         self.server_connections: Dict[str, ServerConnectionStatus] = {}
         
@@ -78,18 +122,19 @@ class MCPAgentOrchestrator:
         self._log_initialization()
 
     def _setup_logging(self) -> None:
-        """Configure logging for the orchestrator."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        """
+        Bind the orchestrator logger.
+        
+        Handlers and levels are configured once by the application entry
+        point (see cli/main.py), not by every orchestrator instance.
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _log_initialization(self) -> None:
         """Log initialization information."""
         self.logger.info("MCP Agent Orchestrator initialized successfully")
         if self.config.tool_filter:
-            self.logger.info(f"Tool filtering enabled: {len(self.config.tool_filter)} tools allowed")
+            self.logger.info("Tool filtering enabled: %d tools allowed", len(self.config.tool_filter))
         else:
             self.logger.info("No tool filtering - all available tools will be loaded")
 
@@ -113,6 +158,11 @@ class MCPAgentOrchestrator:
                 self.logger.warning("No toolsets discovered. Agent will have limited capabilities.")
                 return
 
+            try:
+                from google.adk import Agent
+            except ImportError as e:
+                raise RuntimeError(f"Missing required Google ADK dependencies: {e}") from e
+
             # Create the AI agent with Gemini 2.0 Flash Experimental
             # For now, we'll create the agent without tools since we're using mock toolsets
             self.ai_agent = Agent(
@@ -122,33 +172,15 @@ class MCPAgentOrchestrator:
             )
 
             self.active_toolsets = toolsets
-            self.logger.info(f"AI agent initialized successfully with {len(toolsets)} MCP toolsets")
+            self.logger.info("AI agent initialized successfully with %d MCP toolsets", len(toolsets))
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize AI agent: {str(e)}")
+            self.logger.error("Failed to initialize AI agent: %s", e)
             raise RuntimeError(f"Agent initialization failed: {str(e)}")
 
     def _generate_agent_instructions(self) -> str:
         """Generate comprehensive system instructions for the AI agent."""
-        return """You are an advanced AI assistant with integrated access to specialized tools and capabilities.
-
-Your primary functions include:
-• Temperature conversion operations between Celsius, Fahrenheit, and Kelvin scales
-• Local file system operations and terminal command execution
-• Comprehensive explanations of mathematical formulas and processes
-
-For temperature conversions:
-• Validate input values against physical constraints
-• Display the specific conversion formula utilized
-• Round numerical results to appropriate precision levels
-• Process multiple sequential conversions when requested
-
-For file operations:
-• Utilize available terminal tools for file creation, reading, and modification
-• Present output in clear, professional formatting
-• Verify successful completion of file operations
-
-Maintain precision, provide educational value, and demonstrate your methodology clearly."""
+        return _AGENT_INSTRUCTIONS
 
     async def _discover_and_connect_toolsets(self) -> List[Any]:
         """
@@ -162,71 +194,93 @@ Maintain precision, provide educational value, and demonstrate your methodology
         """
         server_configs = config_loader.get_server_configurations()
         connected_toolsets = []
+        server_tool_names: Dict[str, List[str]] = {} # reported together once discovery completes
+
+        self.logger.info("Discovering toolsets from %d configured servers", len(server_configs))
+
+        # Connect to every server concurrently, each bounded by the connection timeout,
+        # so startup takes as long as the slowest server rather than the sum of all of them
+        connection_results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self._connect_to_server(server_name, server_config),
+                    timeout=self.config.connection_timeout
+                )
+                for server_name, server_config in server_configs.items()
+            ),
+            return_exceptions=True # one failing server must not cancel the others
+        )
 
-        self.logger.info(f"Discovering toolsets from {len(server_configs)} configured servers")
-
-        for server_name, server_config in server_configs.items():
-            connection_status = ServerConnectionStatus(name=server_name)
-            
-            try:
-                # Validate server configuration
-                validation_result = config_loader.validate_server_configuration(server_name, server_config)
-                if not validation_result.is_valid:
-                    connection_status.status = "invalid_configuration"
-                    connection_status.error_message = "Configuration validation failed"
-                    self.server_connections[server_name] = connection_status
-                    continue
-
-                # For now, we'll create a simple toolset representation
-                # In a real implementation, this would connect to actual MCP servers
-                mock_toolset = {
-                    "name": server_name,
-                    "type": server_config.get("type", "unknown"),
-                    "tools": self._get_mock_tools_for_server(server_name)
-                }
-
-                if mock_toolset["tools"]:
-                    connected_toolsets.append(mock_toolset)
-                    connection_status.status = "connected"
-                    connection_status.tool_count = len(mock_toolset["tools"])
-                    connection_status.connection_time = asyncio.get_event_loop().time()
-                    
-                    tool_names = [tool["name"] for tool in mock_toolset["tools"]]
-                    self.logger.info(f"Connected to {server_name} with {len(mock_toolset['tools'])} tools: {tool_names}")
-                    formatter.print_tool_summary(server_name, tool_names)
-                else:
-                    connection_status.status = "no_tools_found"
-                    connection_status.error_message = "No tools discovered on server"
-                    self.logger.warning(f"No tools found on {server_name}. Server disabled.")
-
-            except Exception as e:
-                connection_status.status = "connection_error"
-                connection_status.error_message = str(e)
-                self.logger.error(f"Failed to connect to {server_name}: {str(e)}")
+        # Record the outcomes on this task, in configuration order
+        for server_name, result in zip(server_configs, connection_results):
+            if isinstance(result, BaseException):
+                connection_status = ServerConnectionStatus(name=server_name, status="connection_error")
+                connection_status.error_message = str(result) or type(result).__name__
+                self.logger.error("Failed to connect to %s: %s", server_name, connection_status.error_message)
+                toolset = None
+            else:
+                toolset, connection_status = result
 
             self.server_connections[server_name] = connection_status
+            if toolset is not None:
+                connected_toolsets.append(toolset)
+                server_tool_names[server_name] = [tool["name"] for tool in toolset["tools"]]
+
+        if server_tool_names:
+            self.logger.info(
+                "Connected servers:\n%s",
+                "\n".join(f"  {name}: {len(tools)} tools {tools}" for name, tools in server_tool_names.items())
+            )
+            formatter.print_tool_summaries(server_tool_names)
 
-        self.logger.info(f"Successfully connected to {len(connected_toolsets)} out of {len(server_configs)} servers")
+        self.logger.info("Successfully connected to %d out of %d servers", len(connected_toolsets), len(server_configs))
         return connected_toolsets
 
+    async def _connect_to_server(self, server_name: str, server_config: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], ServerConnectionStatus]:
+        """
+        Validate one server configuration and load its toolset.
+        
+        Args:
+            server_name: Name of the configured server
+            server_config: Server configuration dictionary
+            
+        Returns:
+            Tuple of the connected toolset (None if the server is unusable) and its connection status
+        """
+        connection_status = ServerConnectionStatus(name=server_name)
+
+        # Validate server configuration
+        validation_result = config_loader.validate_server_configuration(server_name, server_config)
+        if not validation_result.is_valid:
+            connection_status.status = "invalid_configuration"
+            connection_status.error_message = "Configuration validation failed"
+            return None, connection_status
+
+        # For now, we'll create a simple toolset representation
+        # In a real implementation, this would connect to actual MCP servers
+        mock_toolset = {
+            "name": server_name,
+            "type": server_config.get("type", "unknown"),
+            "tools": self._get_mock_tools_for_server(server_name)
+        }
+
+        if not mock_toolset["tools"]:
+            connection_status.status = "no_tools_found"
+            connection_status.error_message = "No tools discovered on server"
+            self.logger.warning("No tools found on %s. Server disabled.", server_name)
+            return None, connection_status
+
+        connection_status.status = "connected"
+        connection_status.tool_count = len(mock_toolset["tools"])
+        connection_status.connection_time = asyncio.get_running_loop().time()
+        return mock_toolset, connection_status
+
     def _get_mock_tools_for_server(self, server_name: str) -> List[Dict[str, Any]]:
         """Get mock tools for a server based on its name."""
-        if "temperature" in server_name.lower():
-            return [
-                {"name": "celsius_to_fahrenheit", "description": "Convert Celsius to Fahrenheit"},
-                {"name": "fahrenheit_to_celsius", "description": "Convert Fahrenheit to Celsius"},
-                {"name": "celsius_to_kelvin", "description": "Convert Celsius to Kelvin"},
-                {"name": "kelvin_to_celsius", "description": "Convert Kelvin to Celsius"},
-                {"name": "fahrenheit_to_kelvin", "description": "Convert Fahrenheit to Kelvin"},
-                {"name": "kelvin_to_fahrenheit", "description": "Convert Kelvin to Fahrenheit"}
-            ]
-        elif "terminal" in server_name.lower():
-            return [
-                {"name": "run_command", "description": "Execute terminal commands"},
-                {"name": "list_directory", "description": "List directory contents"},
-                {"name": "read_file", "description": "Read file contents"},
-                {"name": "write_file", "description": "Write content to file"}
-            ]
+        server_name = server_name.lower()
+        for name_fragment, tools in _MOCK_TOOL_MATCHERS:
+            if name_fragment in server_name:
+                return [dict(tool) for tool in tools] # fresh dicts, so callers cannot alter the shared catalogue
         return []
 
     async def _build_connection_parameters(self, server_name: str, server_config: Dict[str, Any]) -> Optional[Any]:
@@ -260,15 +314,10 @@ Maintain precision, provide educational value, and demonstrate your methodology
                 args = server_config.get("args", [])
 
                 # Resolve relative paths to absolute paths for Python scripts
-                if args:
-                    project_root = Path(__file__).parent.parent.parent
-                    resolved_args = []
-                    for arg in args:
-                        if not os.path.isabs(arg) and arg.endswith('.py'):
-                            resolved_args.append(str(project_root / arg))
-                        else:
-                            resolved_args.append(arg)
-                    args = resolved_args
+                args = [
+                    os.path.join(_PROJECT_ROOT, arg) if arg.endswith('.py') and not os.path.isabs(arg) else arg
+                    for arg in args
+                ]
                 
                 return {
                     "type": "stdio",
@@ -280,7 +329,7 @@ Maintain precision, provide educational value, and demonstrate your methodology
                 raise ValueError(f"Unsupported transport type: {transport_type}")
                 
         except Exception as e:
-            self.logger.error(f"Error building connection parameters for '{server_name}': {e}")
+            self.logger.error("Error building connection parameters for '%s': %s", server_name, e)
             return None
 
     async def shutdown(self) -> None:
@@ -289,25 +338,52 @@ Maintain precision, provide educational value, and demonstrate your methodology
         """
         self.logger.info("Initiating agent shutdown and connection cleanup...")
         
-        for i, toolset in enumerate(self.active_toolsets):
-            try:
-                # Mock toolsets are dictionaries, so they don't need to be closed
-                if hasattr(toolset, 'close'):
-                    await toolset.close()
-                self.logger.debug(f"Closed toolset {i+1}")
-            except Exception as e:
-                self.logger.error(f"Error closing toolset {i+1}: {e}")
+        # Close every toolset concurrently; mock toolsets are dictionaries, so they don't need to be closed.
+        # Each close is bounded by the connection timeout, so a hung server cannot stall the shutdown.
+        closable_toolsets = [
+            (i, toolset) for i, toolset in enumerate(self.active_toolsets) if hasattr(toolset, 'close')
+        ]
+        close_results = await asyncio.gather(
+            *(
+                asyncio.wait_for(toolset.close(), timeout=self.config.connection_timeout)
+                for _, toolset in closable_toolsets
+            ),
+            return_exceptions=True # one failing toolset must not stop the others from closing
+        )
+        for (i, _), result in zip(closable_toolsets, close_results):
+            if isinstance(result, asyncio.TimeoutError):
+                self.logger.warning("Closing toolset %d timed out after %ss", i + 1, self.config.connection_timeout)
+            elif isinstance(result, Exception):
+                self.logger.error("Error closing toolset %d: %s", i + 1, result)
+            else:
+                self.logger.debug("Closed toolset %d", i + 1)
         
         self.active_toolsets.clear()
         self.ai_agent = None
         
-        # Brief delay to ensure cleanup completes
-        await asyncio.sleep(0.5)
         self.logger.info("Agent shutdown completed successfully")
 
-    def get_connection_status(self) -> Dict[str, ServerConnectionStatus]:
-        """Get the current connection status of all configured servers."""
-        return self.server_connections.copy()
+    def get_connection_status(self) -> Mapping[str, ServerConnectionStatus]:
+        """
+        Get the current connection status of all configured servers.
+        
+        Returns a live read-only view rather than a copy; call ``dict()`` on
+        it to keep a snapshot.
+        """
+        return MappingProxyType(self.server_connections)
+
+    def get_connection_summary(self) -> Tuple[int, int]:
+        """
+        Get the number of connected servers and the number of configured servers.
+        
+        A cheap alternative to get_connection_status() for health checks and
+        summaries that only need the counts.
+        
+        Returns:
+            Tuple of (active connections, total servers)
+        """
+        active_connections = sum(1 for status in self.server_connections.values() if status.status == "connected")
+        return active_connections, len(self.server_connections)
 
     def is_initialized(self) -> bool:
         """Check if the agent is properly initialized and ready for use."""
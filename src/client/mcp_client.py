@@ -5,13 +5,18 @@ This module provides a sophisticated client interface for managing Model Context
 interactions with comprehensive debugging capabilities and session management.
 """
 
+import os
+import json
 import logging
 import asyncio
-from typing import Optional, List, AsyncGenerator, Any, Dict
+from typing import TYPE_CHECKING, Optional, Collection, AsyncGenerator, Any, Dict
 from dataclasses import dataclass
-from google.genai.types import Content, Part
-from google.adk import Runner
-from google.adk.sessions import InMemorySessionService
+
+# google.adk and the GenAI types are imported where they are first needed, so
+# importing this module (or the src.client package) does not load the ADK stack
+if TYPE_CHECKING:
+    from google.genai.types import Content
+    from google.adk import Runner
 
 from src.agent.agent_wrapper import MCPAgentOrchestrator
 from src.utils.formatters import formatter
@@ -19,7 +24,7 @@ from src.utils.formatters import formatter
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientSessionInfo:
     """Information about the client session."""
     app_identifier: str
@@ -36,12 +41,18 @@ class AdvancedMCPCommunicationInterface:
     servers, featuring real-time streaming, detailed debugging, and robust session handling.
     """
     
+    # Length of the text preview shown in per-event debugging summaries
+    debug_preview_chars: int = 120
+    
+    # Events streamed back-to-back before the loop is handed to other coroutines
+    events_per_loop_yield: int = 16
+    
     def __init__(
         self,
         application_name: str = "universal_mcp_interface",
         user_identifier: str = "default_user",
         session_identifier: str = "default_session",
-        allowed_tools: Optional[List[str]] = None,
+        allowed_tools: Optional[Collection[str]] = None,
         verbose_debugging: bool = False
     ):
         """
@@ -51,7 +62,7 @@ class AdvancedMCPCommunicationInterface:
             application_name: Application identifier for ADK framework
             user_identifier: Unique user identifier for session context
             session_identifier: Session identifier for conversation tracking
-            allowed_tools: Optional list of permitted tool names
+            allowed_tools: Optional collection of permitted tool names
             verbose_debugging: Enable comprehensive debugging of MCP interactions
         """
         self.session_info = ClientSessionInfo(
@@ -62,14 +73,18 @@ class AdvancedMCPCommunicationInterface:
         )
         
         # Initialize core communication components
+        from google.adk.sessions import InMemorySessionService
         self.session_manager = InMemorySessionService()
         self.agent_orchestrator = MCPAgentOrchestrator(tool_allowlist=allowed_tools)
-        self.execution_runner: Optional[Runner] = None
+        self.execution_runner: Optional["Runner"] = None
         
         # State management
         self.initialization_complete = False
         
-        logger.info(f"Advanced MCP Interface initialized for user '{user_identifier}', session '{session_identifier}'")
+        # Verbose debugging prints a one-line summary per event unless full dumps are requested
+        self.full_event_dumps = os.getenv("MCP_DEBUG_FULL", "").strip().lower() in {"1", "true", "yes"}
+        
+        logger.info("Advanced MCP Interface initialized for user '%s', session '%s'", user_identifier, session_identifier)
         if verbose_debugging:
             logger.info("Verbose debugging enabled - comprehensive MCP interaction details will be displayed")
     
@@ -102,6 +117,7 @@ class AdvancedMCPCommunicationInterface:
                 raise RuntimeError("Agent orchestrator failed to initialize properly")
             
             # Create execution runner for agent processing
+            from google.adk import Runner
             self.execution_runner = Runner(
                 agent=self.agent_orchestrator.ai_agent,
                 app_name=self.session_info.app_identifier,
@@ -112,27 +128,32 @@ class AdvancedMCPCommunicationInterface:
             logger.info("MCP communication interface initialized successfully")
             
             # Display server connection status summary
-            connection_status = self.agent_orchestrator.get_connection_status()
-            active_connections = sum(1 for s in connection_status.values() if s.status == "connected")
-            logger.info(f"Server connection status: {active_connections}/{len(connection_status)} servers active")
+            active_connections, total_servers = self.agent_orchestrator.get_connection_summary()
+            logger.info("Server connection status: %d/%d servers active", active_connections, total_servers)
             
         except Exception as e:
-            logger.error(f"Failed to establish MCP communication session: {e}")
+            logger.error("Failed to establish MCP communication session: %s", e)
             await self.terminate_session()
             raise
 
-    async def process_user_input(self, user_input: str) -> AsyncGenerator[Any, None]:
+    def process_user_input(self, user_input: str) -> AsyncGenerator[Any, None]:
         """
         Process user input and stream the agent's response with comprehensive debugging.
         
+        The input is validated immediately; the returned stream is chosen once per
+        call, so with debugging disabled events are passed through without any
+        per-event formatting or checks.
+        
         Args:
             user_input: User input message to process
             
-        Yields:
-            Streaming response events from the agent with detailed MCP interaction information
+        Returns:
+            Async generator of streaming response events from the agent, with detailed
+            MCP interaction information displayed when debugging is enabled
             
         Raises:
             RuntimeError: If communication interface is not initialized
+            ValueError: If the user input is empty
         """
         if not self.initialization_complete:
             raise RuntimeError("Communication interface not initialized. Call establish_communication_session() first.")
@@ -140,15 +161,48 @@ class AdvancedMCPCommunicationInterface:
         if not user_input.strip():
             raise ValueError("User input cannot be empty")
         
-        logger.info(f"Processing user input: {user_input[:100]}{'...' if len(user_input) > 100 else ''}")
+        logger.info("Processing user input: %.100s%s", user_input, '...' if len(user_input) > 100 else '')
+        
+        # Create content structure for ADK framework
+        from google.genai.types import Content, Part
+        content_structure = Content(
+            role="user",
+            parts=[Part(text=user_input)]
+        )
+        
+        if self.session_info.debug_enabled:
+            return self._stream_events_with_debugging(content_structure)
+        return self._stream_events(content_structure)
+    
+    async def _stream_events(self, content_structure: "Content") -> AsyncGenerator[Any, None]:
+        """
+        Stream the agent's response events unchanged.
         
+        When events arrive in a burst the generator may resume without ever suspending,
+        so after every events_per_loop_yield events it gives other coroutines a turn.
+        """
+        events_per_loop_yield = self.events_per_loop_yield
+        emitted_since_yield = 0
+        try:
+            async for response_event in self.execution_runner.run_async(
+                user_id=self.session_info.user_identifier,
+                session_id=self.session_info.session_identifier,
+                new_message=content_structure
+            ):
+                yield response_event
+                emitted_since_yield += 1
+                if emitted_since_yield >= events_per_loop_yield:
+                    emitted_since_yield = 0
+                    await asyncio.sleep(0)
+                
+        except Exception as e:
+            logger.error("Error processing user input: %s", e)
+            raise
+    
+    async def _stream_events_with_debugging(self, content_structure: "Content") -> AsyncGenerator[Any, None]:
+        """Stream the agent's response events, displaying each one in detail first."""
+        full_event_dumps = self.full_event_dumps
         try:
-            # Create content structure for ADK framework
-            content_structure = Content(
-                role="user",
-                parts=[Part(text=user_input)]
-            )
-            
             event_sequence = 0
             # Process through agent and yield streaming responses with debugging
             async for response_event in self.execution_runner.run_async(
@@ -158,22 +212,48 @@ class AdvancedMCPCommunicationInterface:
             ):
                 event_sequence += 1
                 
-                # Display comprehensive debugging information
-                if self.session_info.debug_enabled:
+                if full_event_dumps:
                     # Create a formatted output object for the response event
                     formatted_output = formatter.create_success_response(
                         data=response_event,
                         message=f"Event #{event_sequence}"
                     )
                     print(formatter.format_to_json(formatted_output))
-                    self._examine_response_event(response_event, event_sequence)
+                else:
+                    # Serializing a whole event (tool payloads included) dominates the stream;
+                    # a small projection of it is enough to follow the interaction
+                    print(json.dumps(self._summarize_event(response_event, event_sequence), default=str))
+                self._examine_response_event(response_event, event_sequence)
                 
                 yield response_event
                 
         except Exception as e:
-            logger.error(f"Error processing user input: {e}")
+            logger.error("Error processing user input: %s", e)
             raise
 
+    def _summarize_event(self, response_event: Any, event_sequence: int) -> Dict[str, Any]:
+        """
+        Build a compact summary of a response event for verbose debugging output.
+        
+        Args:
+            response_event: The response event object from the agent
+            event_sequence: Sequential event number for tracking
+            
+        Returns:
+            Dictionary with the event number, type, author, a text preview and the tools it calls
+        """
+        content_parts = getattr(getattr(response_event, 'content', None), 'parts', None)
+        text_preview = getattr(content_parts[0], 'text', None) if content_parts else None
+        get_function_calls = getattr(response_event, 'get_function_calls', None)
+        
+        return {
+            "seq": event_sequence,
+            "type": type(response_event).__name__,
+            "author": getattr(response_event, 'author', None),
+            "text_preview": text_preview[:self.debug_preview_chars] if text_preview else None,
+            "tools": [call.name for call in get_function_calls()] if get_function_calls is not None else []
+        }
+    
     def _examine_response_event(self, response_event: Any, event_sequence: int) -> None:
         """
         Examine and display comprehensive information about MCP response events.
@@ -183,44 +263,48 @@ class AdvancedMCPCommunicationInterface:
             event_sequence: Sequential event number for tracking
         """
         try:
+            # Probe each optional attribute once; getattr with a default replaces
+            # the hasattr-then-access pairs, and is_final_response() runs only once
+            tool_calls = getattr(response_event, 'tool_calls', None)
+            tool_responses = getattr(response_event, 'tool_responses', None)
+            content_parts = getattr(getattr(response_event, 'content', None), 'parts', None)
+            is_final_response = getattr(response_event, 'is_final_response', None)
+            is_final = is_final_response() if is_final_response is not None else False
+            
             # Examine tool-related events
-            if hasattr(response_event, 'tool_calls') and response_event.tool_calls:
-                for tool_invocation in response_event.tool_calls:
-                    tool_name = tool_invocation.name if hasattr(tool_invocation, 'name') else "Unknown"
+            if tool_calls:
+                for tool_invocation in tool_calls:
+                    tool_name = getattr(tool_invocation, 'name', "Unknown")
                     formatter.print_tool_summary(
                         "tool_invocation",
                         [tool_name]
                     )
-                    logger.debug(f"Tool invocation: {tool_name}")
+                    logger.debug("Tool invocation: %s", tool_name)
             
             # Examine tool response events
-            if hasattr(response_event, 'tool_responses') and response_event.tool_responses:
-                for tool_result in response_event.tool_responses:
+            if tool_responses:
+                for tool_result in tool_responses:
                     tool_name = getattr(tool_result, 'name', 'Unknown')
                     execution_status = "success" if not hasattr(tool_result, 'error') else "error"
-                    logger.debug(f"Tool execution result: {tool_name} - {execution_status}")
+                    logger.debug("Tool execution result: %s - %s", tool_name, execution_status)
             
             # Examine agent processing events
-            if hasattr(response_event, 'content') and hasattr(response_event.content, 'parts'):
-                if response_event.content.parts and not getattr(response_event, 'is_final_response', lambda: False)():
-                    processing_content = response_event.content.parts[0].text if response_event.content.parts else "Processing..."
-                    logger.debug(f"Agent processing: {processing_content[:100]}...")
+            if content_parts and not is_final:
+                logger.debug("Agent processing: %.100s...", content_parts[0].text)
             
             # Examine final response events
-            if hasattr(response_event, 'is_final_response') and response_event.is_final_response():
-                final_content = ""
-                if hasattr(response_event, 'content') and hasattr(response_event.content, 'parts') and response_event.content.parts:
-                    final_content = response_event.content.parts[0].text
+            if is_final:
+                final_content = content_parts[0].text if content_parts else ""
                 
-                logger.info(f"Final agent response: {final_content[:200]}{'...' if len(final_content) > 200 else ''}")
+                logger.info("Final agent response: %.200s%s", final_content, '...' if len(final_content) > 200 else '')
                 
         except Exception as e:
-            logger.debug(f"Error examining response event {event_sequence}: {e}")
+            logger.debug("Error examining response event %d: %s", event_sequence, e)
 
     def toggle_verbose_debugging(self) -> bool:
         """Toggle verbose debugging mode on/off and return new state."""
         self.session_info.debug_enabled = not self.session_info.debug_enabled
-        logger.info(f"Verbose debugging {'enabled' if self.session_info.debug_enabled else 'disabled'}")
+        logger.info("Verbose debugging %s", 'enabled' if self.session_info.debug_enabled else 'disabled')
         return self.session_info.debug_enabled
 
     async def terminate_session(self) -> None:
@@ -240,15 +324,23 @@ class AdvancedMCPCommunicationInterface:
             logger.info("MCP communication session terminated successfully")
             
         except Exception as e:
-            logger.error(f"Error during session termination: {e}")
+            logger.error("Error during session termination: %s", e)
 
-    def get_interface_status(self) -> Dict[str, Any]:
+    def get_interface_status(self, include_connection_details: bool = True) -> Dict[str, Any]:
         """
         Get comprehensive interface status information.
         
+        Args:
+            include_connection_details: Include the per-server connection status
+                mapping; frequent pollers such as health checks can pass False and
+                rely on the active/total server counts
+        
         Returns:
             Dictionary with detailed interface status information
         """
+        active_servers, total_servers = (
+            self.agent_orchestrator.get_connection_summary() if self.agent_orchestrator else (0, 0)
+        )
         status = {
             "initialization_complete": self.initialization_complete,
             "verbose_debugging": self.session_info.debug_enabled,
@@ -256,7 +348,12 @@ class AdvancedMCPCommunicationInterface:
             "user_identifier": self.session_info.user_identifier,
             "session_identifier": self.session_info.session_identifier,
             "agent_ready": self.agent_orchestrator.is_initialized() if self.agent_orchestrator else False,
-            "server_connection_status": self.agent_orchestrator.get_connection_status() if self.agent_orchestrator else {}
+            "active_servers": active_servers,
+            "total_servers": total_servers
         }
+        if include_connection_details:
+            status["server_connection_status"] = (
+                self.agent_orchestrator.get_connection_status() if self.agent_orchestrator else {}
+            )
         
         return status
@@ -9,7 +9,7 @@ import json
 import os
 from pathlib import Path
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
@@ -19,12 +19,37 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _flatten_configuration(node: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """
+    Yield a (dotted path, value) pair for every value reachable in a nested configuration.
+    
+    Intermediate dictionaries are yielded as well as leaves. Keys that contain
+    a dot are skipped, since a dotted path could never address them.
+    """
+    for key, value in node.items():
+        if not isinstance(key, str) or "." in key:
+            continue
+        path = prefix + key
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten_configuration(value, path + ".")
+
+
+# Fields every server configuration needs, and the extra ones each supported
+# transport type needs; tuples keep the reported order of missing fields stable
+_BASE_REQUIRED_FIELDS = ("type", "description")
+_TYPE_REQUIRED_FIELDS = {
+    "http": ("url",),
+    "stdio": ("command",)
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ServerConfigValidation:
-    """Validation result for server configuration."""
+    """Validation result for server configuration (immutable, as cached results are shared)."""
     is_valid: bool
-    missing_fields: List[str]
-    invalid_fields: List[str]
+    missing_fields: Tuple[str, ...]
+    invalid_fields: Tuple[str, ...]
     error_message: Optional[str] = None
 
 
@@ -40,6 +65,13 @@ class MCPConfigurationManager:
         """
         self.config_file_path = self._determine_config_location(config_file_path)
         self._configuration_cache: Optional[Dict[str, Any]] = None
+        # st_mtime_ns of the file the cached configuration was parsed from
+        self._configuration_mtime_ns: Optional[int] = None
+        # server name -> (validated config object, result); the config is held so it is
+        # compared by identity and cannot be replaced by a new dict reusing its id
+        self._validation_cache: Dict[str, Tuple[Dict[str, Any], ServerConfigValidation]] = {}
+        # (configuration it was built from, dotted path -> value) for get_configuration_value
+        self._flat_configuration: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _determine_config_location(self, custom_path: Optional[str] = None) -> Path:
@@ -57,16 +89,28 @@ class MCPConfigurationManager:
         return project_root / "config" / "servers.json"
     
     def load_configuration(self) -> Dict[str, Any]:
-        """Load and cache the configuration from the determined path."""
-        if self._configuration_cache is not None:
-            return self._configuration_cache
-
+        """
+        Load and cache the configuration from the determined path.
+        
+        The cached configuration is reused for as long as the file's modification
+        time is unchanged, so repeated initializations only cost a stat() call.
+        Editing the file causes it to be parsed (and its servers validated) again.
+        """
         try:
-            if not self.config_file_path.exists():
+            try:
+                config_mtime_ns = self.config_file_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                if self._configuration_cache is not None:
+                    return self._configuration_cache  # keep serving the last good configuration
                 raise FileNotFoundError(f"Configuration file not found at {self.config_file_path}")
-            
+
+            if self._configuration_cache is not None and config_mtime_ns == self._configuration_mtime_ns:
+                return self._configuration_cache
+
             with open(self.config_file_path, "r", encoding="utf-8") as config_file:
                 self._configuration_cache = json.load(config_file)
+            self._configuration_mtime_ns = config_mtime_ns
+            self._validation_cache.clear()
 
             self.logger.info(f"Successfully loaded MCP server configurations from {self.config_file_path}")
             return self._configuration_cache
@@ -89,6 +133,10 @@ class MCPConfigurationManager:
         """
         Validate the configuration for a specific MCP server.
         
+        Results are memoized by the identity of server_config, so a configuration
+        dictionary edited in place is not validated again; call reload_configuration()
+        after such an edit.
+        
         Args:
             server_name: Name of the server being validated
             server_config: Server configuration dictionary
@@ -96,27 +144,26 @@ class MCPConfigurationManager:
         Returns:
             ServerConfigValidation object with validation results
         """
-        missing_fields = []
+        # Configurations are loaded once and not modified, so a result stays valid
+        # for as long as the same configuration object is being validated
+        cached_validation = self._validation_cache.get(server_name)
+        if cached_validation is not None and cached_validation[0] is server_config:
+            return cached_validation[1]
+
         invalid_fields = []
         
-        # Check for required base fields
-        base_required_fields = ["type", "description"]
-        for field in base_required_fields:
-            if field not in server_config:
-                missing_fields.append(field)
-        
-        # Validate server type
+        # Validate server type; an unsupported type has no type-specific fields to check
         server_type = server_config.get("type")
-        if server_type not in ["http", "stdio"]:
+        type_required_fields = _TYPE_REQUIRED_FIELDS.get(server_type)
+        if type_required_fields is None:
             invalid_fields.append(f"type: '{server_type}' is not supported")
+            type_required_fields = ()
         
-        # Type-specific validation
-        if server_type == "http":
-            if "url" not in server_config:
-                missing_fields.append("url")
-        elif server_type == "stdio":
-            if "command" not in server_config:
-                missing_fields.append("command")
+        # Check for required base and type-specific fields
+        missing_fields = [
+            field for field in _BASE_REQUIRED_FIELDS + type_required_fields
+            if field not in server_config
+        ]
         
         # Determine overall validation result
         is_valid = len(missing_fields) == 0 and len(invalid_fields) == 0
@@ -131,22 +178,52 @@ class MCPConfigurationManager:
         else:
             self.logger.debug(f"Server '{server_name}' configuration is valid")
         
-        return ServerConfigValidation(
+        validation_result = ServerConfigValidation(
             is_valid=is_valid,
-            missing_fields=missing_fields,
-            invalid_fields=invalid_fields,
+            missing_fields=tuple(missing_fields),
+            invalid_fields=tuple(invalid_fields),
             error_message=error_message if not is_valid else None
         )
+        self._validation_cache[server_name] = (server_config, validation_result)
+        return validation_result
+
+    def validate_all_server_configurations(self) -> Dict[str, ServerConfigValidation]:
+        """
+        Validate every configured MCP server in one pass.
+        
+        Results come from the same memoized per-server validation, so servers
+        that were already validated are not checked again.
+        
+        Returns:
+            Dictionary mapping server name to its ServerConfigValidation
+        """
+        validate = self.validate_server_configuration
+        validation_results = {
+            server_name: validate(server_name, server_config)
+            for server_name, server_config in self.get_server_configurations().items()
+        }
+        
+        invalid_count = sum(1 for result in validation_results.values() if not result.is_valid)
+        self.logger.info(
+            "Validated %d server configurations (%d invalid)", len(validation_results), invalid_count
+        )
+        return validation_results
 
     def reload_configuration(self) -> Dict[str, Any]:
         """Force reload the configuration file, bypassing cache."""
         self._configuration_cache = None
+        self._configuration_mtime_ns = None
+        self._validation_cache.clear()
+        self._flat_configuration = None
         return self.load_configuration()
 
     def get_configuration_value(self, key_path: str, default: Any = None) -> Any:
         """
         Get a configuration value using dot notation.
         
+        Lookups are served from a flat view of the configuration, built once per
+        loaded configuration and rebuilt when the file has been reparsed.
+        
         Args:
             key_path: Dot-separated path to the configuration value
             default: Default value if key is not found
@@ -156,16 +233,10 @@ class MCPConfigurationManager:
         """
         try:
             configuration = self.load_configuration()
-            keys = key_path.split('.')
-            value = configuration
-            
-            for key in keys:
-                if isinstance(value, dict) and key in value:
-                    value = value[key]
-                else:
-                    return default
+            if self._flat_configuration is None or self._flat_configuration[0] is not configuration:
+                self._flat_configuration = (configuration, dict(_flatten_configuration(configuration)))
             
-            return value
+            return self._flat_configuration[1].get(key_path, default)
             
         except Exception as e:
             self.logger.warning(f"Error accessing configuration key '{key_path}': {e}")
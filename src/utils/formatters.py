@@ -9,12 +9,42 @@ import json
 import logging
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, is_dataclass
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+def _json_fallback(value: Any) -> Any:
+    """Serialize values json cannot handle: nested dataclasses as dicts, anything else as a string."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    return str(value)
+
+
+# Encoders are configured once and reused; json.dumps with any non-default
+# option builds a new JSONEncoder on every call
+_JSON_OUTPUT_ENCODER = json.JSONEncoder(indent=2, default=_json_fallback)
+_INDENTED_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Welcome banner shown when the CLI starts
+_WELCOME_BANNER = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    Advanced MCP Communication Interface                     ║
+║                                                                              ║
+║  Welcome to the Model Context Protocol (MCP) integration system!            ║
+║  This interface provides comprehensive debugging and interaction            ║
+║  capabilities with MCP servers and AI agents.                               ║
+║                                                                              ║
+║  Features:                                                                   ║
+║  • Temperature conversion tools                                              ║
+║  • Terminal command execution                                                ║
+║  • Real-time MCP interaction debugging                                       ║
+║  • Advanced session management                                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+        """
+
+
 class OutputFormat(Enum):
     """Available output formats for displaying information."""
     JSON = "json"
@@ -23,7 +53,7 @@ class OutputFormat(Enum):
     LIST = "list"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FormattedOutput:
     """Structured output format for consistent response handling."""
     success: bool
@@ -145,7 +175,16 @@ class AdvancedResponseFormatter:
             str: JSON representation of the output
         """
         try:
-            return json.dumps(asdict(output), indent=2, default=str)
+            # Built by hand rather than with asdict(), which deep-copies the payload
+            # (for debug output, a whole agent event) only for it to be serialized
+            output_fields = {
+                "success": output.success,
+                "data": output.data,
+                "message": output.message,
+                "timestamp": output.timestamp,
+                "metadata": output.metadata
+            }
+            return _JSON_OUTPUT_ENCODER.encode(output_fields)
         except Exception as e:
             self.logger.error(f"Error converting output to JSON: {e}")
             return json.dumps({
@@ -184,14 +223,14 @@ class AdvancedResponseFormatter:
         if output.data is not None:
             lines.append("Data:")
             if isinstance(output.data, (dict, list)):
-                lines.append(json.dumps(output.data, indent=2))
+                lines.append(_INDENTED_JSON_ENCODER.encode(output.data))
             else:
                 lines.append(str(output.data))
         
         # Metadata section
         if output.metadata:
             lines.append("Metadata:")
-            lines.append(json.dumps(output.metadata, indent=2))
+            lines.append(_INDENTED_JSON_ENCODER.encode(output.metadata))
         
         return "\n".join(lines)
     
@@ -213,31 +252,23 @@ class AdvancedResponseFormatter:
         if not headers:
             headers = list(data[0].keys()) if data else []
         
-        # Calculate column widths
-        column_widths = {}
-        for header in headers:
-            column_widths[header] = len(str(header))
+        # Stringify every cell once; widths and rendering both read this matrix
+        header_cells = [str(header) for header in headers]
+        cell_rows = [[str(row.get(header, "")) for header in headers] for row in data]
         
-        for row in data:
-            for header in headers:
-                value = str(row.get(header, ""))
-                column_widths[header] = max(column_widths[header], len(value))
+        # Calculate column widths
+        column_widths = [
+            max(len(header_cell), max(map(len, column)))
+            for header_cell, column in zip(header_cells, zip(*cell_rows))
+        ]
         
         # Build table
-        table_lines = []
-        
-        # Header row
-        header_row = " | ".join(header.ljust(column_widths[header]) for header in headers)
-        table_lines.append(header_row)
-        table_lines.append("-" * len(header_row))
-        
-        # Data rows
-        for row in data:
-            data_row = " | ".join(
-                str(row.get(header, "")).ljust(column_widths[header])
-                for header in headers
-            )
-            table_lines.append(data_row)
+        header_row = " | ".join([cell.ljust(width) for cell, width in zip(header_cells, column_widths)])
+        table_lines = [header_row, "-" * len(header_row)]
+        table_lines.extend([
+            " | ".join([cell.ljust(width) for cell, width in zip(cells, column_widths)])
+            for cells in cell_rows
+        ])
         
         return "\n".join(table_lines)
     
@@ -252,35 +283,14 @@ class AdvancedResponseFormatter:
         Returns:
             str: Formatted list string
         """
-        lines = []
-        
-        if title:
-            lines.append(title)
-            lines.append("=" * len(title))
-        
-        for i, item in enumerate(items, 1):
-            lines.append(f"{i}. {item}")
+        lines = [title, "=" * len(title)] if title else []
+        lines.extend([f"{i}. {item}" for i, item in enumerate(items, 1)])
         
         return "\n".join(lines)
     
     def print_welcome_banner(self) -> None:
         """Print a welcome banner for the application."""
-        banner = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                    Advanced MCP Communication Interface                     ║
-║                                                                              ║
-║  Welcome to the Model Context Protocol (MCP) integration system!            ║
-║  This interface provides comprehensive debugging and interaction            ║
-║  capabilities with MCP servers and AI agents.                               ║
-║                                                                              ║
-║  Features:                                                                   ║
-║  • Temperature conversion tools                                              ║
-║  • Terminal command execution                                                ║
-║  • Real-time MCP interaction debugging                                       ║
-║  • Advanced session management                                               ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-        """
-        print(banner)
+        print(_WELCOME_BANNER)
     
     def print_tool_summary(self, server_name: str, tool_names: List[str]) -> None:
         """
@@ -294,6 +304,25 @@ class AdvancedResponseFormatter:
         print(summary)
         self.logger.info(summary)
     
+    def print_tool_summaries(self, server_tools: Dict[str, List[str]]) -> None:
+        """
+        Print the tool summaries of several servers as one block.
+        
+        Produces the same lines as print_tool_summary for each server, but
+        with a single write to stdout and a single log record.
+        
+        Args:
+            server_tools: Mapping of server name to its available tool names
+        """
+        if not server_tools:
+            return
+        summary = "\n".join(
+            f"Server '{server_name}' provides {len(tool_names)} tools: {', '.join(tool_names)}"
+            for server_name, tool_names in server_tools.items()
+        )
+        print(summary)
+        self.logger.info("Tool summary:\n%s", summary)
+    
     def format_server_status(self, status_data: Dict[str, Any]) -> str:
         """
         Format server status information for display.
@@ -304,18 +333,15 @@ class AdvancedResponseFormatter:
         Returns:
             str: Formatted status string
         """
-        lines = ["Server Status Summary:"]
-        lines.append("-" * 30)
-        
-        for server_name, status_info in status_data.items():
-            if isinstance(status_info, dict):
-                status = status_info.get("status", "unknown")
-                tool_count = status_info.get("tool_count", 0)
-                lines.append(f"• {server_name}: {status} ({tool_count} tools)")
-            else:
-                lines.append(f"• {server_name}: {status_info}")
-        
-        return "\n".join(lines)
+        return "\n".join([
+            "Server Status Summary:",
+            "-" * 30,
+            *[
+                f"• {server_name}: {status_info.get('status', 'unknown')} ({status_info.get('tool_count', 0)} tools)"
+                if isinstance(status_info, dict) else f"• {server_name}: {status_info}"
+                for server_name, status_info in status_data.items()
+            ]
+        ])
 
 
 # Global formatter instance
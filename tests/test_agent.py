@@ -47,7 +47,7 @@ class TestMCPAgentOrchestrator:
         """Test orchestrator initialization with tool filter."""
         tool_filter = ["tool1", "tool2"]
         orchestrator = MCPAgentOrchestrator(tool_filter)
-        assert orchestrator.config.tool_filter == tool_filter
+        assert orchestrator.config.tool_filter == frozenset(tool_filter)
     
     @pytest.mark.asyncio
     async def test_agent_initialization_success(self, agent_orchestrator):
@@ -74,8 +74,9 @@ class TestMCPAgentOrchestrator:
         instructions = agent_orchestrator._generate_agent_instructions()
         
         assert isinstance(instructions, str)
-        assert "temperature conversion" in instructions.lower()
-        assert "file operations" in instructions.lower()
+        lowered_instructions = instructions.lower()
+        assert "temperature conversion" in lowered_instructions
+        assert "file operations" in lowered_instructions
         assert len(instructions) > 100  # Should be comprehensive
     
     @pytest.mark.asyncio
@@ -134,34 +135,13 @@ class TestMCPAgentOrchestrator:
             mock_params.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_build_connection_parameters_invalid_type(self, agent_orchestrator):
-        """Test connection parameter building with invalid type."""
-        server_config = {
-            "type": "invalid_type"
-        }
-        
-        result = await agent_orchestrator._build_connection_parameters("test_server", server_config)
-        
-        assert result is None
-    
-    @pytest.mark.asyncio
-    async def test_build_connection_parameters_missing_url(self, agent_orchestrator):
-        """Test HTTP connection parameter building with missing URL."""
-        server_config = {
-            "type": "http"
-        }
-        
-        result = await agent_orchestrator._build_connection_parameters("test_server", server_config)
-        
-        assert result is None
-    
-    @pytest.mark.asyncio
-    async def test_build_connection_parameters_missing_command(self, agent_orchestrator):
-        """Test stdio connection parameter building with missing command."""
-        server_config = {
-            "type": "stdio"
-        }
-        
+    @pytest.mark.parametrize("server_config", [
+        pytest.param({"type": "invalid_type"}, id="invalid_type"),
+        pytest.param({"type": "http"}, id="missing_url"),
+        pytest.param({"type": "stdio"}, id="missing_command"),
+    ])
+    async def test_build_connection_parameters_rejected(self, agent_orchestrator, server_config):
+        """Test connection parameter building with an unusable server configuration."""
         result = await agent_orchestrator._build_connection_parameters("test_server", server_config)
         
         assert result is None
@@ -190,6 +170,25 @@ class TestMCPAgentOrchestrator:
         assert "test_server" in result
         assert result["test_server"].status == "connected"
     
+    def test_get_connection_summary(self, agent_orchestrator):
+        """Test counting active and configured servers."""
+        agent_orchestrator.server_connections["up"] = ServerConnectionStatus(name="up", status="connected")
+        agent_orchestrator.server_connections["down"] = ServerConnectionStatus(name="down", status="connection_error")
+        
+        assert agent_orchestrator.get_connection_summary() == (1, 2)
+    
+    def test_get_mock_tools_for_server_returns_copies(self, agent_orchestrator):
+        """Test changing returned mock tools does not affect later calls."""
+        tools = agent_orchestrator._get_mock_tools_for_server("Temperature_Server")
+        tools[0]["name"] = "changed"
+        tools.clear()
+        
+        fresh_tools = agent_orchestrator._get_mock_tools_for_server("temperature_server")
+        
+        assert fresh_tools[0]["name"] == "celsius_to_fahrenheit"
+        assert len(fresh_tools) == 7
+        assert agent_orchestrator._get_mock_tools_for_server("weather_server") == []
+    
     def test_is_initialized_false(self, agent_orchestrator):
         """Test is_initialized when not initialized."""
         assert not agent_orchestrator.is_initialized()
@@ -211,7 +210,7 @@ class TestAgentConfiguration:
         assert config.agent_name == "Universal MCP Assistant"
         assert config.max_retry_attempts == 3
         assert config.connection_timeout == 30
-        assert config.tool_filter == []
+        assert config.tool_filter == frozenset()
 
 
 class TestServerConnectionStatus:
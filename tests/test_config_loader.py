@@ -0,0 +1,204 @@
+"""
+Comprehensive Test Suite for the MCP Configuration Manager.
+
+This module contains unit tests for MCPConfigurationManager, covering
+configuration caching, cache invalidation and server validation.
+"""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+from src.utils.config_loader import MCPConfigurationManager
+
+
+SAMPLE_CONFIGURATION = {
+    "mcpservers": {
+        "temperature_server": {
+            "type": "http",
+            "url": "http://localhost:8001/mcp",
+            "description": "Temperature conversion server"
+        }
+    }
+}
+
+
+def write_configuration(config_path, configuration):
+    """Write a configuration file and move its modification time forward."""
+    previous_mtime_ns = config_path.stat().st_mtime_ns if config_path.exists() else 0
+    config_path.write_text(json.dumps(configuration), encoding="utf-8")
+    # guarantee a visible change even on filesystems with coarse timestamps
+    new_mtime_ns = previous_mtime_ns + 1_000_000_000
+    os.utime(config_path, ns=(new_mtime_ns, new_mtime_ns))
+
+
+class TestConfigurationCaching:
+    """Test cases for configuration caching and invalidation."""
+    
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """Create a configuration file for testing."""
+        config_path = tmp_path / "servers.json"
+        write_configuration(config_path, SAMPLE_CONFIGURATION)
+        return config_path
+    
+    @pytest.fixture
+    def config_manager(self, config_path):
+        """Create an MCPConfigurationManager reading the test configuration file."""
+        return MCPConfigurationManager(str(config_path))
+    
+    def test_unchanged_file_is_not_reparsed(self, config_manager):
+        """Test repeated loads reuse the cached configuration."""
+        with patch('src.utils.config_loader.json.load', wraps=json.load) as mock_json_load:
+            first_configuration = config_manager.load_configuration()
+            second_configuration = config_manager.load_configuration()
+        
+        assert second_configuration is first_configuration
+        assert mock_json_load.call_count == 1
+    
+    def test_changed_file_is_reparsed(self, config_manager, config_path):
+        """Test a newer modification time causes the file to be parsed again."""
+        first_configuration = config_manager.load_configuration()
+        
+        write_configuration(config_path, {"mcpservers": {}})
+        second_configuration = config_manager.load_configuration()
+        
+        assert second_configuration is not first_configuration
+        assert second_configuration == {"mcpservers": {}}
+    
+    def test_touched_file_is_reparsed(self, config_manager, config_path):
+        """Test only touching the file is enough to reparse it."""
+        first_configuration = config_manager.load_configuration()
+        
+        new_mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_path, ns=(new_mtime_ns, new_mtime_ns))
+        
+        assert config_manager.load_configuration() is not first_configuration
+    
+    def test_deleted_file_keeps_last_configuration(self, config_manager, config_path):
+        """Test the last good configuration is served after the file disappears."""
+        first_configuration = config_manager.load_configuration()
+        
+        config_path.unlink()
+        
+        assert config_manager.load_configuration() is first_configuration
+    
+    def test_missing_file_without_cache(self, tmp_path):
+        """Test loading fails when the file never existed."""
+        config_manager = MCPConfigurationManager(str(tmp_path / "missing.json"))
+        
+        with pytest.raises(RuntimeError, match="Configuration file not found"):
+            config_manager.load_configuration()
+    
+    def test_validation_is_memoized_per_configuration(self, config_manager):
+        """Test validation results are reused only for the same configuration object."""
+        server_config = config_manager.get_server_configurations()["temperature_server"]
+        
+        first_result = config_manager.validate_server_configuration("temperature_server", server_config)
+        
+        assert config_manager.validate_server_configuration("temperature_server", server_config) is first_result
+        with pytest.raises(AttributeError):
+            first_result.is_valid = False
+        # an equal but distinct dictionary is validated again
+        assert config_manager.validate_server_configuration("temperature_server", dict(server_config)) is not first_result
+    
+    def test_reparse_clears_validation_cache(self, config_manager, config_path):
+        """Test validation results from an older configuration are discarded on reparse."""
+        server_config = config_manager.get_server_configurations()["temperature_server"]
+        config_manager.validate_server_configuration("temperature_server", server_config)
+        
+        write_configuration(config_path, SAMPLE_CONFIGURATION)
+        config_manager.load_configuration()
+        
+        assert config_manager._validation_cache == {}
+    
+    def test_reload_configuration_clears_caches(self, config_manager):
+        """Test a forced reload drops every cached view of the configuration."""
+        first_configuration = config_manager.load_configuration()
+        server_config = first_configuration["mcpservers"]["temperature_server"]
+        config_manager.validate_server_configuration("temperature_server", server_config)
+        config_manager.get_configuration_value("mcpservers")
+        
+        with patch('src.utils.config_loader.json.load', wraps=json.load) as mock_json_load:
+            reloaded_configuration = config_manager.reload_configuration()
+        
+        assert mock_json_load.call_count == 1
+        assert reloaded_configuration is not first_configuration
+        assert reloaded_configuration == first_configuration
+        assert config_manager._validation_cache == {}
+        assert config_manager._flat_configuration is None
+
+
+class TestConfigurationValueLookup:
+    """Test cases for dot-notation configuration lookups."""
+    
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """Create a configuration file for testing."""
+        config_path = tmp_path / "servers.json"
+        write_configuration(config_path, {**SAMPLE_CONFIGURATION, "dotted.key": "unreachable"})
+        return config_path
+    
+    @pytest.fixture
+    def config_manager(self, config_path):
+        """Create an MCPConfigurationManager reading the test configuration file."""
+        return MCPConfigurationManager(str(config_path))
+    
+    def test_nested_keys_resolve(self, config_manager):
+        """Test leaves and intermediate dictionaries are reachable by dotted path."""
+        assert config_manager.get_configuration_value("mcpservers.temperature_server.url") == "http://localhost:8001/mcp"
+        assert config_manager.get_configuration_value("mcpservers.temperature_server") == \
+            SAMPLE_CONFIGURATION["mcpservers"]["temperature_server"]
+    
+    def test_missing_keys_return_default(self, config_manager):
+        """Test unknown paths, paths through leaves and dotted keys fall back to the default."""
+        assert config_manager.get_configuration_value("mcpservers.unknown_server") is None
+        assert config_manager.get_configuration_value("mcpservers.temperature_server.url.host", "none") == "none"
+        assert config_manager.get_configuration_value("dotted.key", "none") == "none"
+    
+    def test_flat_view_is_reused(self, config_manager):
+        """Test the flat view is built once for an unchanged configuration."""
+        config_manager.get_configuration_value("mcpservers")
+        flat_configuration = config_manager._flat_configuration
+        
+        config_manager.get_configuration_value("mcpservers.temperature_server.type")
+        
+        assert config_manager._flat_configuration is flat_configuration
+    
+    def test_flat_view_is_rebuilt_after_file_change(self, config_manager, config_path):
+        """Test lookups see new values once the configuration file has changed."""
+        assert config_manager.get_configuration_value("mcpservers.temperature_server.type") == "http"
+        
+        write_configuration(config_path, {"mcpservers": {"temperature_server": {"type": "stdio"}}})
+        
+        assert config_manager.get_configuration_value("mcpservers.temperature_server.type") == "stdio"
+        assert config_manager.get_configuration_value("mcpservers.temperature_server.url") is None
+
+
+class TestValidateAllServerConfigurations:
+    """Test cases for validating every configured server at once."""
+    
+    def test_mixed_valid_and_invalid_servers(self, tmp_path):
+        """Test each server gets its own validation result."""
+        config_path = tmp_path / "servers.json"
+        write_configuration(config_path, {
+            "mcpservers": {
+                **SAMPLE_CONFIGURATION["mcpservers"],
+                "terminal_server": {"type": "stdio", "description": "Terminal server without a command"}
+            }
+        })
+        config_manager = MCPConfigurationManager(str(config_path))
+        
+        results = config_manager.validate_all_server_configurations()
+        
+        assert set(results) == {"temperature_server", "terminal_server"}
+        assert results["temperature_server"].is_valid
+        assert results["temperature_server"].error_message is None
+        assert not results["terminal_server"].is_valid
+        assert results["terminal_server"].missing_fields == ("command",)
+        assert results["terminal_server"].invalid_fields == ()
+        assert "terminal_server" in results["terminal_server"].error_message
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
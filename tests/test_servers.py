@@ -7,13 +7,21 @@ including HTTP and stdio servers.
 
 import pytest
 import asyncio
+import logging
+import socket
 import tempfile
 import os
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch
 
 # Import server classes
-from servers.stdio.terminal_server import SecureCommandRequest, CommandExecutionResult
+from servers.stdio.terminal_server import (
+    SecureCommandRequest, CommandExecutionResult, execute_secure_command, _split_simple_command
+)
+from servers.http.temperature_server import (
+    TemperatureInput, FahrenheitInput, KelvinInput, BatchConversionInput, CONVERSIONS, register_tools
+)
+from servers.http.server_launcher import ServerLauncher
 
 
 class TestSecureCommandRequest:
@@ -83,6 +91,151 @@ class TestCommandExecutionResult:
         assert result.execution_time is None
 
 
+class TestTemperatureConversion:
+    """Test cases for the temperature conversion models and table."""
+    
+    def test_temperature_input_range_validation(self):
+        """Test temperature input rejects values outside the supported range."""
+        with pytest.raises(ValueError):
+            TemperatureInput(temperature=100001)
+        with pytest.raises(ValueError):
+            TemperatureInput(temperature=-274)
+    
+    def test_scale_specific_absolute_zero(self):
+        """Test each input scale is bounded by its own absolute zero."""
+        assert FahrenheitInput(temperature=-400).temperature == -400
+        with pytest.raises(ValueError):
+            FahrenheitInput(temperature=-460)
+        with pytest.raises(ValueError):
+            KelvinInput(temperature=-1)
+    
+    @pytest.mark.parametrize("from_scale,to_scale,value,expected", [
+        ("C", "F", 100.0, 212.0),
+        ("F", "C", 32.0, 0.0),
+        ("C", "K", 0.0, 273.15),
+        ("K", "C", 273.15, 0.0),
+        ("F", "K", 212.0, 373.15),
+        ("K", "F", 373.15, 212.0),
+    ])
+    def test_conversion_table(self, from_scale, to_scale, value, expected):
+        """Test every conversion pair against known reference points."""
+        scale, offset, formula = CONVERSIONS[(from_scale, to_scale)]
+        
+        assert scale * value + offset == pytest.approx(expected)
+        assert formula.startswith(to_scale)
+
+
+class TestBatchConvertTool:
+    """Test cases for the batch_convert temperature tool."""
+    
+    @pytest.fixture
+    def batch_convert(self):
+        """Register the temperature tools on a mock server and return batch_convert."""
+        registered_tools = {}
+        mock_server = Mock()
+        mock_server.tool.side_effect = lambda **kwargs: lambda fn: registered_tools.setdefault(fn.__name__, fn)
+        register_tools(mock_server)
+        return registered_tools["batch_convert"]
+    
+    @pytest.mark.asyncio
+    async def test_batch_convert_success(self, batch_convert):
+        """Test every value is converted in input order."""
+        result = await batch_convert(BatchConversionInput(values=[0, 100, -40], from_scale="C", to_scale="F"))
+        
+        assert result.converted_values == pytest.approx([32.0, 212.0, -40.0])
+        assert result.original_values == [0, 100, -40]
+        assert result.converted_scale == "F"
+        assert result.formula == "F = (C * 9/5) + 32"
+    
+    @pytest.mark.asyncio
+    async def test_batch_convert_same_scale(self, batch_convert):
+        """Test converting to the source scale is rejected."""
+        with pytest.raises(ValueError, match="must be different"):
+            await batch_convert(BatchConversionInput(values=[10], from_scale="K", to_scale="K"))
+    
+    @pytest.mark.asyncio
+    async def test_batch_convert_below_absolute_zero(self, batch_convert):
+        """Test values below the source scale's absolute zero are rejected."""
+        with pytest.raises(ValueError, match=r"absolute zero \(-459.67 F\)"):
+            await batch_convert(BatchConversionInput(values=[0, -460], from_scale="F", to_scale="C"))
+    
+    @pytest.mark.asyncio
+    async def test_batch_convert_above_maximum(self, batch_convert):
+        """Test values above the supported maximum are rejected with the source scale's range."""
+        with pytest.raises(ValueError, match="between 0.0 and 100000"):
+            await batch_convert(BatchConversionInput(values=[100001], from_scale="K", to_scale="C"))
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+    async def test_batch_convert_non_finite(self, batch_convert, value):
+        """Test NaN and infinite values are rejected."""
+        with pytest.raises(ValueError, match="finite"):
+            await batch_convert(BatchConversionInput(values=[20, value], from_scale="C", to_scale="F"))
+
+
+class TestInProcessServerLauncher:
+    """Test cases for in-process temperature servers that fail to start."""
+    
+    @pytest.mark.asyncio
+    async def test_port_in_use_is_cleaned_up(self, caplog):
+        """Test a server whose port is taken is forgotten without a timeout warning."""
+        launcher = ServerLauncher()
+        with socket.socket() as occupied_socket:
+            occupied_socket.bind(("127.0.0.1", 0))
+            occupied_socket.listen()
+            port = occupied_socket.getsockname()[1]
+            
+            with caplog.at_level(logging.WARNING, logger="servers.http.server_launcher"):
+                started = await launcher.start_temperature_server_in_process(host="127.0.0.1", port=port)
+        
+        assert started is False
+        assert launcher.in_process_servers == []
+        assert "did not start in time" not in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_startup_timeout_stops_server(self, caplog):
+        """Test a server still starting at the deadline is stopped and forgotten."""
+        launcher = ServerLauncher()
+        startup_cancelled = asyncio.Event()
+        
+        async def hanging_serve(sockets=None):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                startup_cancelled.set()
+                raise
+        
+        with patch('servers.http.server_launcher._InProcessServer.serve', side_effect=hanging_serve), \
+                caplog.at_level(logging.WARNING, logger="servers.http.server_launcher"):
+            started = await launcher.start_temperature_server_in_process(port=0, timeout=0.05)
+        
+        assert started is False
+        assert launcher.in_process_servers == []
+        assert startup_cancelled.is_set()
+        assert "did not start in time" in caplog.text
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="commands always run through the shell on Windows")
+class TestSimpleCommandSplitting:
+    """Test cases for deciding whether a command needs a shell."""
+    
+    def test_plain_command_is_split(self):
+        """Test a plain program invocation is executed without a shell."""
+        assert _split_simple_command("echo 'Hello World'") == ["echo", "Hello World"]
+    
+    @pytest.mark.parametrize("command", [
+        "echo 'Hello from test' > test_output.txt",
+        "ls *.txt",
+        "echo $HOME",
+        "cd subdir",
+        "nonexistentcommand12345",
+        "echo 'unclosed quote",
+    ])
+    def test_shell_commands_are_not_split(self, command):
+        """Test commands relying on the shell keep running through it."""
+        assert _split_simple_command(command) is None
+
+
 class TestTerminalServerIntegration:
     """Integration tests for terminal server functionality."""
     
@@ -92,46 +245,44 @@ class TestTerminalServerIntegration:
         with tempfile.TemporaryDirectory() as temp_dir:
             yield Path(temp_dir)
     
+    @pytest.fixture(autouse=True)
+    def workspace_directory(self, temp_workspace):
+        """Run every command of these tests inside the temporary workspace."""
+        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
+            yield temp_workspace
+    
     @pytest.mark.asyncio
     async def test_secure_command_execution_success(self, temp_workspace):
         """Test successful secure command execution."""
-        # Mock the workspace directory
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
-            request = SecureCommandRequest(command="echo 'Hello World'")
-            
-            result = await execute_secure_command(request)
-            
-            assert result.command == "echo 'Hello World'"
-            assert result.exit_code == 0
-            assert "Hello World" in result.stdout
-            assert result.stderr == ""
-            assert result.working_directory == str(temp_workspace)
-            assert result.execution_time is not None
-            assert result.execution_time > 0
+        request = SecureCommandRequest(command="echo 'Hello World'")
+        
+        result = await execute_secure_command(request)
+        
+        assert result.command == "echo 'Hello World'"
+        assert result.exit_code == 0
+        assert "Hello World" in result.stdout
+        assert result.stderr == ""
+        assert result.working_directory == str(temp_workspace)
+        assert result.execution_time is not None
+        assert result.execution_time > 0
     
     @pytest.mark.asyncio
     async def test_secure_command_execution_error(self, temp_workspace):
         """Test command execution with error."""
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
-            request = SecureCommandRequest(command="nonexistentcommand12345")
-            
-            result = await execute_secure_command(request)
-            
-            assert result.command == "nonexistentcommand12345"
-            assert result.exit_code != 0
-            assert result.stderr != ""
-            assert result.working_directory == str(temp_workspace)
+        request = SecureCommandRequest(command="nonexistentcommand12345")
+        
+        result = await execute_secure_command(request)
+        
+        assert result.command == "nonexistentcommand12345"
+        assert result.exit_code != 0
+        assert result.stderr != ""
+        assert result.working_directory == str(temp_workspace)
     
     @pytest.mark.asyncio
     async def test_secure_command_execution_timeout(self, temp_workspace):
         """Test command execution timeout handling."""
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
+        # A short limit exercises the same kill-and-report path without waiting 30 seconds
+        with patch('servers.stdio.terminal_server.COMMAND_TIMEOUT_SECONDS', 0.2):
             # Create a command that would run indefinitely
             if os.name == 'nt':  # Windows
                 command = "ping -t 127.0.0.1"
@@ -147,103 +298,117 @@ class TestTerminalServerIntegration:
             assert "timed out" in result.stderr.lower()
             assert result.working_directory == str(temp_workspace)
     
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(os.name == 'nt', reason="process groups are only killed on Unix-like systems")
+    async def test_secure_command_timeout_group_already_gone(self, temp_workspace):
+        """Test a timeout is still reported when the process group vanishes before it is killed."""
+        real_killpg = os.killpg
+        
+        def kill_then_report_missing(pid, sig):
+            real_killpg(pid, sig)
+            raise ProcessLookupError
+        
+        with patch('servers.stdio.terminal_server.COMMAND_TIMEOUT_SECONDS', 0.2), \
+                patch('servers.stdio.terminal_server.os.killpg', side_effect=kill_then_report_missing):
+            result = await execute_secure_command(SecureCommandRequest(command="sleep 60"))
+        
+        assert result.exit_code == -1
+        assert "timed out" in result.stderr.lower()
+    
     @pytest.mark.asyncio
     async def test_secure_command_workspace_isolation(self, temp_workspace):
         """Test that commands are properly isolated to workspace."""
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
-            # Create a test file in the workspace
-            test_file = temp_workspace / "test.txt"
-            test_file.write_text("test content")
-            
-            # Try to access the file
-            request = SecureCommandRequest(command=f"cat {test_file.name}")
-            
-            result = await execute_secure_command(request)
-            
-            assert result.exit_code == 0
-            assert "test content" in result.stdout
+        # Create a test file in the workspace
+        test_file = temp_workspace / "test.txt"
+        test_file.write_text("test content")
+        
+        # Try to access the file
+        request = SecureCommandRequest(command=f"cat {test_file.name}")
+        
+        result = await execute_secure_command(request)
+        
+        assert result.exit_code == 0
+        assert "test content" in result.stdout
     
     @pytest.mark.asyncio
     async def test_secure_command_file_operations(self, temp_workspace):
         """Test file operations within the secure workspace."""
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
-            # Create a new file
-            request = SecureCommandRequest(command="echo 'Hello from test' > test_output.txt")
-            result = await execute_secure_command(request)
-            
-            assert result.exit_code == 0
-            
-            # Read the file
-            request = SecureCommandRequest(command="cat test_output.txt")
-            result = await execute_secure_command(request)
-            
-            assert result.exit_code == 0
-            assert "Hello from test" in result.stdout
+        # Create a new file
+        request = SecureCommandRequest(command="echo 'Hello from test' > test_output.txt")
+        result = await execute_secure_command(request)
+        
+        assert result.exit_code == 0
+        
+        # Read the file
+        request = SecureCommandRequest(command="cat test_output.txt")
+        result = await execute_secure_command(request)
+        
+        assert result.exit_code == 0
+        assert "Hello from test" in result.stdout
     
     @pytest.mark.asyncio
     async def test_secure_command_directory_listing(self, temp_workspace):
         """Test directory listing functionality."""
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
-            # Create some test files
-            (temp_workspace / "file1.txt").write_text("content1")
-            (temp_workspace / "file2.txt").write_text("content2")
-            
-            # List directory contents
-            request = SecureCommandRequest(command="ls -la" if os.name != 'nt' else "dir")
-            result = await execute_secure_command(request)
-            
-            assert result.exit_code == 0
-            assert "file1.txt" in result.stdout
-            assert "file2.txt" in result.stdout
+        # Create some test files
+        (temp_workspace / "file1.txt").write_text("content1")
+        (temp_workspace / "file2.txt").write_text("content2")
+        
+        # List directory contents
+        request = SecureCommandRequest(command="ls -la" if os.name != 'nt' else "dir")
+        result = await execute_secure_command(request)
+        
+        assert result.exit_code == 0
+        assert "file1.txt" in result.stdout
+        assert "file2.txt" in result.stdout
+    
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(os.name == 'nt', reason="uses the Unix yes and head commands")
+    async def test_secure_command_output_capped(self, temp_workspace):
+        """Test large output is capped and marked as truncated without blocking the command."""
+        # 200,000 bytes is well beyond the pipe buffer, so an unread pipe would stall the command
+        with patch('servers.stdio.terminal_server.MAX_CAPTURE_BYTES', 1000):
+            result = await execute_secure_command(SecureCommandRequest(command="yes | head -n 100000"))
+        
+        assert result.exit_code == 0
+        assert result.stdout.startswith("y\n" * 500)
+        assert result.stdout.endswith("\n... [output truncated, 199000 further bytes discarded]")
+        assert len(result.stdout) < 1100
     
     @pytest.mark.asyncio
     async def test_secure_command_multiple_commands(self, temp_workspace):
         """Test multiple command executions."""
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
-            commands = [
-                "echo 'First command'",
-                "echo 'Second command'",
-                "echo 'Third command'"
-            ]
-            
-            results = []
-            for cmd in commands:
-                request = SecureCommandRequest(command=cmd)
-                result = await execute_secure_command(request)
-                results.append(result)
-            
-            assert len(results) == 3
-            for result in results:
-                assert result.exit_code == 0
-                assert result.execution_time is not None
+        commands = [
+            "echo 'First command'",
+            "echo 'Second command'",
+            "echo 'Third command'"
+        ]
+        
+        # The commands are independent, so they run concurrently
+        results = await asyncio.gather(
+            *(execute_secure_command(SecureCommandRequest(command=cmd)) for cmd in commands)
+        )
+        
+        assert len(results) == 3
+        for result in results:
+            assert result.exit_code == 0
+            assert result.execution_time is not None
     
     @pytest.mark.asyncio
     async def test_secure_command_error_handling(self, temp_workspace):
         """Test error handling for various command failures."""
-        with patch('servers.stdio.terminal_server.WORKSPACE_DIRECTORY', temp_workspace):
-            from servers.stdio.terminal_server import execute_secure_command
-            
-            # Test command that doesn't exist
-            request = SecureCommandRequest(command="thiscommanddoesnotexist12345")
-            result = await execute_secure_command(request)
-            
-            assert result.exit_code != 0
-            assert result.stderr != ""
-            
-            # Test command with syntax error
-            request = SecureCommandRequest(command="echo 'unclosed quote")
-            result = await execute_secure_command(request)
-            
-            # The behavior may vary by shell, but should handle gracefully
-            assert result is not None
+        # Test command that doesn't exist
+        request = SecureCommandRequest(command="thiscommanddoesnotexist12345")
+        result = await execute_secure_command(request)
+        
+        assert result.exit_code != 0
+        assert result.stderr != ""
+        
+        # Test command with syntax error
+        request = SecureCommandRequest(command="echo 'unclosed quote")
+        result = await execute_secure_command(request)
+        
+        # The behavior may vary by shell, but should handle gracefully
+        assert result is not None
 
 
 if __name__ == "__main__":